@@ -146,9 +146,9 @@ def main():
 def _cmd_schema(args):
     """Handle the schema subcommand."""
     import json
-    from hammer.spec import HammerSpec
+    from hammer.spec import spec_json_schema
 
-    schema = json.dumps(HammerSpec.model_json_schema(), indent=2)
+    schema = json.dumps(spec_json_schema(), indent=2)
 
     if args.out:
         with open(args.out, "w") as f:
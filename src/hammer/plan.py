@@ -214,11 +214,7 @@ def resolve_node_selector(selector: NodeSelector, topology: Topology) -> List[st
 
     # group selector
     if selector.group:
-        result = []
-        for n in topology.nodes:
-            if selector.group in n.groups:
-                result.append(n.name)
-        return result
+        return list(topology.group_members.get(selector.group, ()))
     
     return []
 
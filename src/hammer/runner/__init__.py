@@ -20,6 +20,7 @@ from hammer.runner.results import (
     TestResult,
     calculate_phase_score,
     calculate_total_score,
+    dump_result_json,
     write_handler_runs,
 )
 from hammer.runner.ansible import run_playbook, check_idempotence
@@ -121,10 +122,9 @@ def grade_assignment(
         report.phases[phase] = phase_result
 
     # Calculate total scores
-    total_earned, total_max, percentage = calculate_total_score(report.phases)
+    total_earned, total_max, _ = calculate_total_score(report.phases)
     report.total_score = total_earned
     report.max_score = total_max
-    report.percentage = percentage
 
     # Check for any failures (converge must succeed AND all tests must pass)
     report.success = all(
@@ -379,7 +379,7 @@ def _run_phase(
     # Save converge artifacts
     (results_dir / "converge.log").write_text(converge_log)
     (results_dir / "converge_result.json").write_text(
-        converge_result.model_dump_json(indent=2)
+        dump_result_json(converge_result)
     )
     write_handler_runs(grading_dir, phase, converge_result)
 
@@ -417,7 +417,7 @@ def _run_phase(
 
     (results_dir / "test.log").write_text(test_log)
     (results_dir / "test_result.json").write_text(
-        test_result.model_dump_json(indent=2)
+        dump_result_json(test_result)
     )
 
     if verbose:
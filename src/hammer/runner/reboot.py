@@ -1,32 +1,82 @@
 """HAMMER Reboot Module.
 
 Provides functionality to reboot nodes after converge and wait for SSH availability.
+Nodes are rebooted concurrently, so total wall time is bounded by the slowest node
+rather than the sum of all reboots.
 """
 
+import asyncio
+import configparser
+import functools
 import os
-import subprocess
+import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Seconds to wait for SSH to drop after the reboot command is sent
+SSH_DOWN_TIMEOUT = 30
+
+# Exit code of ansible when a host became unreachable
+ANSIBLE_RC_UNREACHABLE = 4
+
+# SSH multiplexing and pipelining for every ansible call made here, so the
+# many pings issued while waiting on a reboot reuse one control socket.
+# These mirror the grading bundle's ansible.cfg, which is not picked up
+# because these commands do not run from the bundle directory. Each is
+# only a default: it is skipped when the variable is already set or the
+# active ansible.cfg sets any of the matching (section, option) pairs.
+_ANSIBLE_ENV_DEFAULTS = {
+    "ANSIBLE_SSH_ARGS": (
+        {("ssh_connection", "ssh_args")},
+        "-o ControlMaster=auto -o ControlPersist=60s",
+    ),
+    "ANSIBLE_PIPELINING": (
+        {
+            ("ssh_connection", "pipelining"),
+            ("connection", "pipelining"),
+            ("defaults", "pipelining"),
+        },
+        "True",
+    ),
+    "ANSIBLE_TIMEOUT": ({("defaults", "timeout")}, "5"),
+}
+
+# Phase-2 polling starts quickly and backs off towards poll_interval, so a
+# node that returns early is noticed within about a second
+INITIAL_POLL_DELAY = 1.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# A node whose SSH port missed this many banner probes in a row is pinged
+# anyway, in case its real address or port comes from group or host vars
+BANNER_MISSES_BEFORE_PING = 3
+
+# Matches one host's result in `ansible -m ping --one-line` output
+_PING_LINE_RE = re.compile(r"^(\S+) \| (SUCCESS|UNREACHABLE!|FAILED!)")
+
 
 @dataclass
 class RebootResult:
     """Result of a reboot operation for a single node."""
     success: bool
     duration: float
-    error: Optional[str] = None
+    error: str | None = None
 
 
 def reboot_nodes(
     inventory_path: Path,
-    nodes: Optional[List[str]],
+    nodes: list[str] | None,
     timeout: int = int(os.environ.get("HAMMER_REBOOT_TIMEOUT", "120")),
     poll_interval: int = 5,
-) -> Dict[str, RebootResult]:
+) -> dict[str, RebootResult]:
     """
     Reboot specified nodes and wait for SSH to come back.
 
@@ -39,60 +89,355 @@ def reboot_nodes(
     Returns:
         Dict mapping node name to RebootResult
     """
-    results = {}
-
     # Get node list from inventory if not specified
     if nodes is None:
         nodes = _get_all_nodes_from_inventory(inventory_path)
 
-    for node in nodes:
-        results[node] = _reboot_single_node(
-            inventory_path, node, timeout, poll_interval
-        )
+    # Convert once; every ansible argv below shares this string
+    inventory = str(inventory_path)
+
+    return asyncio.run(
+        _reboot_nodes_async(inventory, nodes, timeout, poll_interval)
+    )
+
+
+async def _reboot_nodes_async(
+    inventory: str,
+    nodes: list[str],
+    timeout: int,
+    poll_interval: int,
+) -> dict[str, RebootResult]:
+    """
+    Reboot all nodes concurrently, one coroutine per node.
+
+    Args:
+        inventory: Path to the Ansible inventory file
+        nodes: List of node names to reboot
+        timeout: Maximum seconds to wait for SSH per node
+        poll_interval: Seconds between SSH availability checks
+
+    Returns:
+        Dict mapping node name to RebootResult
+    """
+    watcher = _SshWatcher(inventory, poll_interval)
+    outcomes = await asyncio.gather(
+        *[
+            _reboot_single_node(inventory, node, timeout, poll_interval, watcher)
+            for node in nodes
+        ],
+        return_exceptions=True,
+    )
+
+    results = {}
+    for node, outcome in zip(nodes, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = RebootResult(
+                success=False,
+                duration=0.0,
+                error=f"Reboot of {node} raised: {outcome}",
+            )
+        results[node] = outcome
 
     return results
 
 
-def _reboot_single_node(
-    inventory_path: Path,
+def _ansible_env() -> dict[str, str]:
+    """
+    Build the environment for ansible subprocesses.
+
+    Host key checking is disabled as in runner/ansible.py; the connection
+    settings in _ANSIBLE_ENV_DEFAULTS never override the operator's own.
+    """
+    env = dict(os.environ)
+    configured = _ansible_config_options()
+    for name, (options, value) in _ANSIBLE_ENV_DEFAULTS.items():
+        if name not in env and not options & configured:
+            env[name] = value
+    env["ANSIBLE_HOST_KEY_CHECKING"] = "False"
+    return env
+
+
+def _ansible_config_options() -> set[tuple[str, str]]:
+    """
+    Read which options the active ansible.cfg sets.
+
+    The file is located the way ansible does: $ANSIBLE_CONFIG, then
+    ./ansible.cfg, ~/.ansible.cfg and /etc/ansible/ansible.cfg.
+
+    Returns:
+        Set of (section, option) pairs, empty if no config file is readable
+    """
+    candidates = [
+        os.environ.get("ANSIBLE_CONFIG"),
+        "ansible.cfg",
+        os.path.expanduser("~/.ansible.cfg"),
+        "/etc/ansible/ansible.cfg",
+    ]
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            parser = configparser.ConfigParser(
+                allow_no_value=True, interpolation=None, strict=False
+            )
+            try:
+                parser.read(candidate)
+            except configparser.Error:
+                return set()
+            return {
+                (section, option)
+                for section in parser.sections()
+                for option in parser.options(section)
+            }
+    return set()
+
+
+async def _run_ansible(args: list[str], timeout: float) -> int | None:
+    """
+    Run an ad-hoc ansible command with its output discarded.
+
+    Args:
+        args: Arguments passed to the ``ansible`` executable
+        timeout: Maximum seconds to wait for the command to finish
+
+    Returns:
+        The exit code, or None if the command timed out
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "ansible", *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=_ansible_env(),
+    )
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+
+
+class _SshWatcher:
+    """
+    Waits for SSH to come back on many nodes at once.
+
+    Each tick first probes every waiting node's SSH port directly, which
+    needs no subprocess. Only nodes whose sshd answers (or whose address
+    is not in the inventory) are then confirmed by a single batched
+    ``ansible -m ping``. Every BANNER_MISSES_BEFORE_PING missed probes a
+    node is pinged regardless, so a wrong inventory address only slows it
+    down. Ticks start INITIAL_POLL_DELAY apart and back off up to
+    poll_interval.
+    """
+
+    def __init__(self, inventory: str, poll_interval: float):
+        self._inventory = inventory
+        self._poll_interval = poll_interval
+        self._addresses = _get_ssh_addresses(inventory)
+        self._banner_misses: dict[str, int] = {}
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._task: asyncio.Task | None = None
+
+    async def wait_until_up(self, node: str) -> None:
+        """Wait until SSH on the node answers a ping."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(node, []).append(future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._poll())
+        try:
+            await future
+        finally:
+            # Drop the waiter if we were cancelled (e.g. by a timeout)
+            waiters = self._waiters.get(node)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[node]
+
+    async def _poll(self) -> None:
+        """Ping all waiting nodes once per tick until none are left."""
+        delay = min(INITIAL_POLL_DELAY, self._poll_interval)
+        while self._waiters:
+            candidates = await self._sshd_answering(list(self._waiters))
+            status = (
+                await _check_ssh_available_batch(self._inventory, candidates)
+                if candidates else {}
+            )
+            for node, available in status.items():
+                if available:
+                    for future in self._waiters.pop(node, []):
+                        if not future.done():
+                            future.set_result(None)
+            if self._waiters:
+                await asyncio.sleep(delay)
+                delay = min(delay * POLL_BACKOFF_FACTOR, self._poll_interval)
+
+    async def _sshd_answering(self, nodes: list[str]) -> list[str]:
+        """Return the nodes that are worth confirming with an ansible ping."""
+        probed = [node for node in nodes if node in self._addresses]
+        banners = await asyncio.gather(
+            *[_check_ssh_banner(*self._addresses[node]) for node in probed]
+        )
+        candidates = set()
+        for node, answered in zip(probed, banners):
+            if answered:
+                self._banner_misses.pop(node, None)
+                candidates.add(node)
+                continue
+            misses = self._banner_misses.get(node, 0) + 1
+            self._banner_misses[node] = misses
+            if misses % BANNER_MISSES_BEFORE_PING == 0:
+                candidates.add(node)
+        return [
+            node for node in nodes
+            if node in candidates or node not in self._addresses
+        ]
+
+
+async def _check_ssh_banner(host: str, port: int, timeout: float = 3) -> bool:
+    """
+    Check that an SSH server is answering, without spawning a process.
+
+    Args:
+        host: Address of the node
+        port: SSH port of the node
+        timeout: Maximum seconds for connecting and reading the banner
+
+    Returns:
+        True if the server sent an SSH protocol banner
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    try:
+        banner = await asyncio.wait_for(reader.readexactly(4), timeout)
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+        return False
+    finally:
+        writer.close()
+
+    return banner == b"SSH-"
+
+
+async def _start_ssh_sentinel(
+    inventory: str,
+    node: str,
+) -> asyncio.subprocess.Process | None:
+    """
+    Open a long-lived SSH session to a node that exits when the node goes down.
+
+    Args:
+        inventory: Path to the Ansible inventory file
+        node: Name of the node to watch
+
+    Returns:
+        The sentinel process, or None if it could not be started
+    """
+    try:
+        return await asyncio.create_subprocess_exec(
+            "ansible", node,
+            "-i", inventory,
+            "-m", "command",
+            "-a", "sleep 300",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=_ansible_env(),
+        )
+    except OSError:
+        return None
+
+
+async def _wait_for_exit(proc: asyncio.subprocess.Process, timeout: float) -> bool:
+    """
+    Wait for a process to exit without polling.
+
+    The event loop's child watcher is woken by the kernel when the process
+    exits (via a pidfd where the platform supports it).
+
+    Args:
+        proc: The process to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    try:
+        await asyncio.wait_for(proc.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+
+
+async def _poll_ssh_down(inventory: str, node: str) -> bool:
+    """
+    Poll a node with Ansible ping until SSH stops answering.
+
+    Used when the SSH sentinel session cannot be started.
+
+    Args:
+        inventory: Path to the Ansible inventory file
+        node: Name of the node to check
+
+    Returns:
+        True if SSH went down within SSH_DOWN_TIMEOUT seconds
+    """
+    for _ in range(SSH_DOWN_TIMEOUT):
+        if not await _check_ssh_available(inventory, node):
+            return True
+        await asyncio.sleep(1)
+    return False
+
+
+async def _reboot_single_node(
+    inventory: str,
     node: str,
     timeout: int,
     poll_interval: int,
+    watcher: _SshWatcher | None = None,
 ) -> RebootResult:
     """
     Reboot a single node via Ansible and wait for it to come back.
 
     Args:
-        inventory_path: Path to the Ansible inventory file
+        inventory: Path to the Ansible inventory file
         node: Name of the node to reboot
         timeout: Maximum seconds to wait for SSH
         poll_interval: Seconds between SSH availability checks
+        watcher: Shared SSH watcher batching checks across nodes
 
     Returns:
         RebootResult with success status and timing info
     """
     start_time = time.time()
 
+    # Hold an SSH session open before rebooting; its exit marks SSH going down
+    sentinel = await _start_ssh_sentinel(inventory, node)
+
     # Send reboot command using Ansible's async mode
     # -B 1 = background with 1 second timeout (fire and forget)
     # -P 0 = don't poll for result
+    # A timeout is expected here - the connection may drop before the
+    # command completes.
     try:
-        subprocess.run(
+        await _run_ansible(
             [
-                "ansible", node,
-                "-i", str(inventory_path),
+                node,
+                "-i", inventory,
                 "-m", "shell",
                 "-a", "sleep 2 && sudo reboot",
                 "-B", "1",
                 "-P", "0",
             ],
             timeout=30,
-            capture_output=True,
         )
-    except subprocess.TimeoutExpired:
-        # Expected - connection may drop before command completes
-        pass
     except Exception as e:
+        if sentinel is not None and sentinel.returncode is None:
+            sentinel.kill()
+            await sentinel.wait()
         return RebootResult(
             success=False,
             duration=time.time() - start_time,
@@ -100,12 +445,14 @@ def _reboot_single_node(
         )
 
     # Phase 1: Wait for SSH to go DOWN (confirms reboot initiated)
-    ssh_went_down = False
-    for _ in range(30):
-        if not _check_ssh_available(inventory_path, node):
-            ssh_went_down = True
-            break
-        time.sleep(1)
+    if sentinel is not None:
+        ssh_went_down = await _wait_for_exit(sentinel, SSH_DOWN_TIMEOUT)
+        if ssh_went_down and sentinel.returncode != ANSIBLE_RC_UNREACHABLE:
+            # The sentinel failed for another reason (auth, module error,
+            # no hosts matched), possibly before the reboot fired
+            ssh_went_down = await _poll_ssh_down(inventory, node)
+    else:
+        ssh_went_down = await _poll_ssh_down(inventory, node)
 
     if not ssh_went_down:
         return RebootResult(
@@ -115,69 +462,203 @@ def _reboot_single_node(
         )
 
     # Phase 2: Wait for SSH to come back
-    elapsed = time.time() - start_time
-    while elapsed < timeout:
-        if _check_ssh_available(inventory_path, node):
-            return RebootResult(
-                success=True,
-                duration=time.time() - start_time,
-            )
-        time.sleep(poll_interval)
-        elapsed = time.time() - start_time
+    if watcher is None:
+        watcher = _SshWatcher(inventory, poll_interval)
+    remaining = timeout - (time.time() - start_time)
+    try:
+        await asyncio.wait_for(watcher.wait_until_up(node), max(remaining, 0))
+    except asyncio.TimeoutError:
+        return RebootResult(
+            success=False,
+            duration=timeout,
+            error=f"SSH did not become available within {timeout}s",
+        )
 
     return RebootResult(
-        success=False,
-        duration=timeout,
-        error=f"SSH did not become available within {timeout}s",
+        success=True,
+        duration=time.time() - start_time,
     )
 
 
-def _check_ssh_available(inventory_path: Path, node: str) -> bool:
+async def _check_ssh_available(inventory: str, node: str) -> bool:
     """
     Check if SSH is available on a node using Ansible ping.
 
     Args:
-        inventory_path: Path to the Ansible inventory file
+        inventory: Path to the Ansible inventory file
         node: Name of the node to check
 
     Returns:
         True if node is reachable via SSH
     """
     try:
-        result = subprocess.run(
+        returncode = await _run_ansible(
             [
-                "ansible", node,
-                "-i", str(inventory_path),
+                node,
+                "-i", inventory,
                 "-m", "ping",
             ],
             timeout=10,
-            capture_output=True,
         )
-        return result.returncode == 0
-    except subprocess.TimeoutExpired:
-        return False
+        return returncode == 0
     except Exception:
         return False
 
 
-def _get_all_nodes_from_inventory(inventory_path: Path) -> List[str]:
+async def _check_ssh_available_batch(
+    inventory: str,
+    nodes: list[str],
+) -> dict[str, bool]:
+    """
+    Check SSH availability on several nodes with a single Ansible ping.
+
+    Args:
+        inventory: Path to the Ansible inventory file
+        nodes: Names of the nodes to check
+
+    Returns:
+        Dict mapping node name to True if reachable via SSH
+    """
+    status = {node: False for node in nodes}
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ansible", ",".join(nodes),
+            "-i", inventory,
+            "-m", "ping",
+            "--one-line",
+            "-f", str(len(nodes)),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=_ansible_env(),
+        )
+    except OSError:
+        return status
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), 10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return status
+
+    for line in stdout.decode(errors="replace").splitlines():
+        match = _PING_LINE_RE.match(line)
+        if match and match.group(1) in status:
+            status[match.group(1)] = match.group(2) == "SUCCESS"
+
+    return status
+
+
+def _get_all_nodes_from_inventory(inventory_path: Path) -> list[str]:
     """
     Get all node names from an Ansible inventory file.
 
+    The parsed result is cached per file version (path, mtime, size), so
+    repeated reboots across phases only parse the inventory once.
+
     Args:
         inventory_path: Path to the Ansible inventory file (YAML format)
 
     Returns:
-        List of node names
+        Sorted list of node names
+    """
+    return [name for name, _, _ in _get_inventory_hosts(inventory_path)]
+
+
+def _get_ssh_addresses(
+    inventory_path: str | Path,
+) -> dict[str, tuple[str, int]]:
+    """
+    Get the SSH address of nodes in an Ansible inventory file.
+
+    Only nodes with an ansible_host set on the host itself are included;
+    any other node's address may come from group or host vars files.
+
+    Args:
+        inventory_path: Path to the Ansible inventory file (YAML format)
+
+    Returns:
+        Dict mapping node name to (ansible_host, ansible_port)
+    """
+    return {
+        name: (host, port)
+        for name, host, port in _get_inventory_hosts(inventory_path)
+        if host is not None
+    }
+
+
+def _get_inventory_hosts(
+    inventory_path: str | Path,
+) -> tuple[tuple[str, str | None, int], ...]:
+    """Stat the inventory and return its cached (name, host, port) entries."""
+    try:
+        st = os.stat(inventory_path)
+    except OSError:
+        return ()
+
+    return _load_inventory_hosts(str(inventory_path), st.st_mtime_ns, st.st_size)
+
+
+def _host_address(host_vars: dict) -> tuple[str, int] | None:
+    """
+    Get the SSH address a host entry sets explicitly.
+
+    Args:
+        host_vars: Variables on the host's inventory entry
+
+    Returns:
+        (ansible_host, ansible_port), or None if the entry sets no usable
+        address (no ansible_host, or a templated or non-integer value)
+    """
+    if "ansible_host" not in host_vars:
+        return None
+    host = str(host_vars["ansible_host"])
+    if "{{" in host:
+        return None
+    try:
+        port = int(host_vars.get("ansible_port", 22))
+    except (TypeError, ValueError):
+        return None
+    return host, port
+
+
+@functools.lru_cache(maxsize=32)
+def _load_inventory_hosts(
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[tuple[str, str | None, int], ...]:
+    """
+    Parse hosts and their SSH addresses from an inventory file.
+
+    Args:
+        path: Path to the Ansible inventory file (YAML format)
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+
+    Returns:
+        Tuple of (node name, ansible_host, ansible_port), sorted by name.
+        ansible_host is None when the host entry does not set it.
     """
-    nodes = []
+    hosts: dict[str, tuple[str | None, int]] = {}
+
+    def add_hosts(section: dict) -> None:
+        for name, host_vars in section.items():
+            host_vars = host_vars if isinstance(host_vars, dict) else {}
+            address = _host_address(host_vars)
+            if address is not None:
+                hosts[name] = address
+            else:
+                # Keep an address from another group's entry for this host
+                hosts.setdefault(name, (None, 22))
 
     try:
-        with open(inventory_path, "r") as f:
-            inventory = yaml.safe_load(f)
+        # libyaml decodes the raw bytes itself
+        with open(path, "rb") as f:
+            inventory = yaml.load(f, Loader=_YamlLoader)
 
         if not inventory:
-            return nodes
+            return ()
 
         # Handle YAML inventory format
         # Typical structure: all.hosts or all.children.<group>.hosts
@@ -186,17 +667,17 @@ def _get_all_nodes_from_inventory(inventory_path: Path) -> List[str]:
 
             # Direct hosts under 'all'
             if "hosts" in all_section:
-                nodes.extend(all_section["hosts"].keys())
+                add_hosts(all_section["hosts"])
 
             # Hosts in child groups
             if "children" in all_section:
                 for group_name, group_data in all_section["children"].items():
                     if isinstance(group_data, dict) and "hosts" in group_data:
-                        nodes.extend(group_data["hosts"].keys())
+                        add_hosts(group_data["hosts"])
 
     except Exception:
         # If we can't parse the inventory, return empty list
         # The reboot will fail gracefully
         pass
 
-    return list(set(nodes))  # Remove duplicates
+    return tuple((name, *hosts[name]) for name in sorted(hosts))
@@ -4,14 +4,20 @@ Provides structured representations of grading results.
 """
 
 import json
+import os
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
-class ConvergeResult(BaseModel):
+# Per-run result types are plain slotted dataclasses: they are built
+# internally (never from untrusted input), so Pydantic validation would be
+# pure overhead. GradeReport stays a Pydantic model for its JSON output.
+@dataclass(slots=True)
+class ConvergeResult:
     """Result of an Ansible converge run."""
 
     ok: int = 0
@@ -21,13 +27,15 @@ class ConvergeResult(BaseModel):
     skipped: int = 0
     rescued: int = 0
     ignored: int = 0
-    play_recap: Dict[str, Dict[str, int]] = Field(default_factory=dict)
-    handlers_run: Dict[str, int] = Field(default_factory=dict)  # handler_name -> run count
+    play_recap: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # handler_name -> run count
+    handlers_run: Dict[str, int] = field(default_factory=dict)
     success: bool = True
     error_message: Optional[str] = None
 
 
-class TestCaseResult(BaseModel):
+@dataclass(slots=True)
+class TestCaseResult:
     """Result of a single test case."""
     __test__ = False
 
@@ -38,7 +46,8 @@ class TestCaseResult(BaseModel):
     message: Optional[str] = None
 
 
-class TestResult(BaseModel):
+@dataclass(slots=True)
+class TestResult:
     """Aggregated test results for a phase."""
     __test__ = False
 
@@ -48,10 +57,11 @@ class TestResult(BaseModel):
     errors: int = 0
     total_weight: float = 0.0
     earned_weight: float = 0.0
-    details: List[TestCaseResult] = Field(default_factory=list)
+    details: List[TestCaseResult] = field(default_factory=list)
 
 
-class PhaseResult(BaseModel):
+@dataclass(slots=True)
+class PhaseResult:
     """Complete result for a single phase."""
 
     phase: str
@@ -70,10 +80,32 @@ class GradeReport(BaseModel):
     phases: Dict[str, PhaseResult] = Field(default_factory=dict)
     total_score: float = 0.0
     max_score: float = 0.0
-    percentage: float = 0.0
     success: bool = True
     error_message: Optional[str] = None
 
+    @computed_field
+    @property
+    def percentage(self) -> float:
+        """Total score as a percentage of the maximum score."""
+        if not self.max_score:
+            return 0.0
+        return (self.total_score / self.max_score) * 100
+
+
+def dump_result_json(
+    result: Union[ConvergeResult, TestCaseResult, TestResult, PhaseResult],
+) -> str:
+    """
+    Serialize a result dataclass to indented JSON.
+
+    Args:
+        result: A ConvergeResult, TestCaseResult, TestResult or PhaseResult
+
+    Returns:
+        JSON string
+    """
+    return json.dumps(asdict(result), indent=2)
+
 
 def calculate_phase_score(tests: TestResult) -> tuple[float, float]:
     """
@@ -95,8 +127,10 @@ def calculate_total_score(phases: Dict[str, PhaseResult]) -> tuple[float, float,
     Returns:
         Tuple of (total_earned, total_max, percentage)
     """
-    total_earned = sum(p.score for p in phases.values())
-    total_max = sum(p.max_score for p in phases.values())
+    total_earned = total_max = 0.0
+    for p in phases.values():
+        total_earned += p.score
+        total_max += p.max_score
 
     if total_max == 0:
         return 0.0, 0.0, 0.0
@@ -125,6 +159,13 @@ def write_handler_runs(
     handler_runs_dir.mkdir(parents=True, exist_ok=True)
 
     handler_file = handler_runs_dir / f"{phase}.json"
-    handler_file.write_text(json.dumps(converge_result.handlers_run, indent=2))
+
+    # Write to a temp file and rename so test verifiers never read a
+    # partially written file
+    tmp_file = handler_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(
+        json.dumps(converge_result.handlers_run, indent=2).encode()
+    )
+    os.replace(tmp_file, handler_file)
 
     return handler_file
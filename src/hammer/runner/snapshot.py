@@ -3,10 +3,11 @@
 Generates and runs playbooks to collect system state.
 """
 
+import functools
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from hammer.spec import HammerSpec
 from hammer.plan import ExecutionPlan
@@ -15,14 +16,22 @@ from hammer.plan import ExecutionPlan
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_env() -> Environment:
-    """Get Jinja2 environment with templates."""
+    """Get Jinja2 environment with templates, shared for the process."""
     return Environment(
         loader=FileSystemLoader(TEMPLATES_DIR),
         keep_trailing_newline=True,
+        auto_reload=False,
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_snapshot_template() -> Template:
+    """Get the compiled snapshot playbook template."""
+    return _get_env().get_template("snapshot_playbook.yml.j2")
+
+
 def get_files_to_check(spec: HammerSpec, plan: ExecutionPlan) -> List[str]:
     """
     Extract list of files that need to be checked from spec.
@@ -34,20 +43,22 @@ def get_files_to_check(spec: HammerSpec, plan: ExecutionPlan) -> List[str]:
     Returns:
         List of file paths to check
     """
-    files: Set[str] = set()
-
-    # Get files from behavioral contracts
-    if spec.behavioral_contracts and spec.behavioral_contracts.files:
-        for fc in spec.behavioral_contracts.files:
-            for item in fc.items:
-                files.add(item.path)
-
-    # Get files from binding targets
-    for var in (spec.variable_contracts or []):
-        for binding in var.binding_targets:
-            target = binding.target
-            if hasattr(target, "path"):
-                files.add(target.path)
+    bc = spec.behavioral_contracts
+
+    # Files from behavioral contracts
+    files: Set[str] = {
+        item.path
+        for fc in ((bc.files or ()) if bc else ())
+        for item in fc.items
+    }
+
+    # Files from binding targets (only file-based targets carry a path)
+    files.update(
+        path
+        for var in spec.variable_contracts or ()
+        for binding in var.binding_targets
+        if (path := getattr(binding.target, "path", None))
+    )
 
     return sorted(files)
 
@@ -70,8 +81,7 @@ def render_snapshot_playbook(
     Returns:
         Rendered playbook YAML as string
     """
-    env = _get_env()
-    template = env.get_template("snapshot_playbook.yml.j2")
+    template = _get_snapshot_template()
 
     files_to_check = get_files_to_check(spec, plan)
 
@@ -107,6 +117,10 @@ def write_snapshot_playbook(
     content = render_snapshot_playbook(spec, plan, phase, snapshot_dir)
 
     playbook_path = output_dir / f"snapshot_{phase}.yml"
-    playbook_path.write_text(content)
+
+    # Leave an identical playbook untouched so its mtime stays stable
+    data = content.encode()
+    if not (playbook_path.is_file() and playbook_path.read_bytes() == data):
+        playbook_path.write_bytes(data)
 
     return playbook_path
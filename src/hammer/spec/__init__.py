@@ -5,6 +5,7 @@ Usage: ``from hammer.spec import HammerSpec, Node, ...`` continues to work.
 
 # Primitives
 from hammer.spec.primitives import (
+    SpecModel,
     NonEmptyStr,
     PhaseName,
     ExecutionPhaseName,
@@ -15,6 +16,7 @@ from hammer.spec.primitives import (
     ExpectedRuns,
     ReachabilityExpectation,
     Protocol,
+    HttpMethod,
     FeatureFlags,
 )
 
@@ -96,13 +98,15 @@ from hammer.spec.overlays import (
 from hammer.spec.root import (
     HammerSpec,
     load_spec_from_file,
+    spec_json_schema,
+    validate_semantics,
 )
 
 __all__ = [
     # Primitives
-    "NonEmptyStr", "PhaseName", "ExecutionPhaseName", "VarType",
+    "SpecModel", "NonEmptyStr", "PhaseName", "ExecutionPhaseName", "VarType",
     "OverlayKind", "BindingMode", "PrecedenceLayer", "ExpectedRuns",
-    "ReachabilityExpectation", "Protocol", "FeatureFlags",
+    "ReachabilityExpectation", "Protocol", "HttpMethod", "FeatureFlags",
     # Topology
     "NodeResources", "ForwardedPort", "Node", "Dependency", "Topology",
     # Entrypoints
@@ -126,5 +130,6 @@ __all__ = [
     "IdempotenceEnforcement", "IdempotencePolicy", "VaultSpec",
     "FailurePolicy", "RebootConfig", "PhaseOverlay", "PhaseOverlays",
     # Root
-    "HammerSpec", "load_spec_from_file",
+    "HammerSpec", "load_spec_from_file", "spec_json_schema",
+    "validate_semantics",
 ]
@@ -1,15 +1,18 @@
 """Behavioral contract models for HAMMER spec."""
 
-from typing import List, Optional, Union, Literal
+from typing import Annotated, List, Optional, Union, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, Tag, model_validator
 
 from hammer.validators import SafeIdentifier, SafePath, SafePattern, SafeZone
 from hammer.spec.primitives import (
+    SpecModel,
     NonEmptyStr,
     ExecutionPhaseName,
     ReachabilityExpectation,
     Protocol,
+    HttpMethod,
+    key_discriminator,
 )
 
 
@@ -17,7 +20,7 @@ from hammer.spec.primitives import (
 # Node selector
 # -------------------------
 
-class NodeSelector(BaseModel):
+class NodeSelector(SpecModel):
     group: Optional[SafeIdentifier] = None
     host: Optional[SafeIdentifier] = None
 
@@ -33,18 +36,21 @@ class NodeSelector(BaseModel):
 # Port references
 # -------------------------
 
-class PortRefVar(BaseModel):
+class PortRefVar(SpecModel):
     var: SafeIdentifier
 
 
-PortRef = Union[int, PortRefVar]
+PortRef = Annotated[
+    Union[Annotated[int, Tag("int")], Annotated[PortRefVar, Tag("var")]],
+    key_discriminator("var", default="int"),
+]
 
 
 # -------------------------
 # Behavioral contracts
 # -------------------------
 
-class PackageContract(BaseModel):
+class PackageContract(SpecModel):
     name: SafeIdentifier
     state: Literal["present", "absent"]
     node_selector: NodeSelector
@@ -52,7 +58,7 @@ class PackageContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class PipPackageContract(BaseModel):
+class PipPackageContract(SpecModel):
     """Contract for verifying pip packages are installed."""
     name: NonEmptyStr  # pip names can have dots, etc.
     state: Literal["present", "absent"] = "present"
@@ -62,7 +68,7 @@ class PipPackageContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class ServiceContract(BaseModel):
+class ServiceContract(SpecModel):
     name: SafeIdentifier
     enabled: bool
     running: bool
@@ -71,7 +77,7 @@ class ServiceContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class UserContract(BaseModel):
+class UserContract(SpecModel):
     """Contract for verifying system users exist with specified properties."""
     name: SafeIdentifier
     exists: bool = True
@@ -85,7 +91,7 @@ class UserContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class GroupContract(BaseModel):
+class GroupContract(SpecModel):
     """Contract for verifying system groups exist with specified properties."""
     name: SafeIdentifier
     exists: bool = True
@@ -95,7 +101,7 @@ class GroupContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class FirewallPort(BaseModel):
+class FirewallPort(SpecModel):
     port: PortRef
     protocol: Protocol
     zone: SafeZone
@@ -104,7 +110,7 @@ class FirewallPort(BaseModel):
 FirewallType = Literal["firewalld", "iptables"]
 
 
-class FirewallContract(BaseModel):
+class FirewallContract(SpecModel):
     open_ports: List[FirewallPort]
     node_selector: NodeSelector
     firewall_type: FirewallType = "firewalld"
@@ -112,7 +118,7 @@ class FirewallContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class FileContractItem(BaseModel):
+class FileContractItem(SpecModel):
     path: SafePath
     present: bool
     is_directory: bool = False
@@ -122,14 +128,14 @@ class FileContractItem(BaseModel):
     content_regex: Optional[SafePattern] = None
 
 
-class FilesContract(BaseModel):
+class FilesContract(SpecModel):
     items: List[FileContractItem]
     node_selector: NodeSelector
     phases: Optional[List[ExecutionPhaseName]] = None
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class ReachabilityContract(BaseModel):
+class ReachabilityContract(SpecModel):
     from_host: SafeIdentifier
     to_host: SafeIdentifier
     protocol: Protocol
@@ -139,10 +145,10 @@ class ReachabilityContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class HttpEndpointContract(BaseModel):
+class HttpEndpointContract(SpecModel):
     """Contract for verifying HTTP endpoints return expected responses."""
     url: NonEmptyStr
-    method: Literal["GET", "POST", "PUT", "DELETE", "HEAD"] = "GET"
+    method: HttpMethod = "GET"
     expected_status: int = Field(default=200, ge=100, le=599)
     response_contains: Optional[SafePattern] = None
     response_regex: Optional[SafePattern] = None
@@ -152,10 +158,10 @@ class HttpEndpointContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class ExternalHttpContract(BaseModel):
+class ExternalHttpContract(SpecModel):
     """Contract for verifying HTTP endpoints from external perspective."""
     url: NonEmptyStr
-    method: Literal["GET", "POST", "PUT", "DELETE", "HEAD"] = "GET"
+    method: HttpMethod = "GET"
     expected_status: int = Field(default=200, ge=100, le=599)
     response_contains: Optional[SafePattern] = None
     response_regex: Optional[SafePattern] = None
@@ -174,7 +180,7 @@ class ExternalHttpContract(BaseModel):
         return self
 
 
-class OutputContract(BaseModel):
+class OutputContract(SpecModel):
     """Contract for verifying Ansible output contains expected patterns."""
     pattern: SafePattern
     match_type: Literal["contains", "regex"] = "contains"
@@ -184,7 +190,7 @@ class OutputContract(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class BehavioralContracts(BaseModel):
+class BehavioralContracts(SpecModel):
     packages: Optional[List[PackageContract]] = None
     pip_packages: Optional[List[PipPackageContract]] = None
     services: Optional[List[ServiceContract]] = None
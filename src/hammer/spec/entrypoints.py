@@ -2,18 +2,17 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from hammer.spec.primitives import SpecModel
 from hammer.validators import SafeIdentifier, SafeRelativePath
 
 
-class ProvidedFile(BaseModel):
+class ProvidedFile(SpecModel):
     """A file provided by the assignment to students."""
     source: SafeRelativePath
     destination: SafeRelativePath
 
 
-class Entrypoints(BaseModel):
+class Entrypoints(SpecModel):
     playbook_path: SafeRelativePath
     required_roles: Optional[List[SafeIdentifier]] = None
     required_files: Optional[List[SafeRelativePath]] = None
@@ -1,11 +1,16 @@
 """Handler, overlay, and policy models for HAMMER spec."""
 
-from typing import Any, Dict, List, Optional, Union, Literal
+from typing import Annotated, Any, Dict, List, Optional, Union, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field, Tag
 
 from hammer.validators import SafeIdentifier, SafePath
-from hammer.spec.primitives import NonEmptyStr, ExpectedRuns
+from hammer.spec.primitives import (
+    SpecModel,
+    NonEmptyStr,
+    ExpectedRuns,
+    key_discriminator,
+)
 from hammer.spec.contracts import NodeSelector
 
 
@@ -13,51 +18,57 @@ from hammer.spec.contracts import NodeSelector
 # Handler contracts
 # -------------------------
 
-class TriggerFileChanged(BaseModel):
+class TriggerFileChanged(SpecModel):
     file_changed: SafePath
 
 
-class TriggerTemplateChanged(BaseModel):
+class TriggerTemplateChanged(SpecModel):
     template_changed: SafePath
 
 
-class TriggerVariableChanged(BaseModel):
+class TriggerVariableChanged(SpecModel):
     variable_changed: SafeIdentifier
 
 
-Trigger = Union[
-    TriggerFileChanged,
-    TriggerTemplateChanged,
-    TriggerVariableChanged,
+Trigger = Annotated[
+    Union[
+        Annotated[TriggerFileChanged, Tag("file_changed")],
+        Annotated[TriggerTemplateChanged, Tag("template_changed")],
+        Annotated[TriggerVariableChanged, Tag("variable_changed")],
+    ],
+    key_discriminator("file_changed", "template_changed", "variable_changed"),
 ]
 
 
-class NonTriggerNoop(BaseModel):
+class NonTriggerNoop(SpecModel):
     noop_rerun: Literal[True]
 
 
-class NonTriggerUnrelatedFile(BaseModel):
+class NonTriggerUnrelatedFile(SpecModel):
     unrelated_file_changed: SafePath
 
 
-NonTrigger = Union[
-    NonTriggerNoop,
-    NonTriggerUnrelatedFile,
+NonTrigger = Annotated[
+    Union[
+        Annotated[NonTriggerNoop, Tag("noop_rerun")],
+        Annotated[NonTriggerUnrelatedFile, Tag("unrelated_file_changed")],
+    ],
+    key_discriminator("noop_rerun", "unrelated_file_changed"),
 ]
 
 
-class HandlerTarget(BaseModel):
+class HandlerTarget(SpecModel):
     service: SafeIdentifier
     action: Literal["restart", "reload"]
 
 
-class ExpectedRunsSet(BaseModel):
+class ExpectedRunsSet(SpecModel):
     baseline: ExpectedRuns
     mutation: ExpectedRuns
     idempotence: ExpectedRuns
 
 
-class HandlerContract(BaseModel):
+class HandlerContract(SpecModel):
     handler_name: NonEmptyStr
     node_selector: NodeSelector
     handler_target: HandlerTarget
@@ -71,12 +82,12 @@ class HandlerContract(BaseModel):
 # Idempotence
 # -------------------------
 
-class IdempotenceEnforcement(BaseModel):
+class IdempotenceEnforcement(SpecModel):
     require_changed_zero: bool = True
     require_no_handlers: bool = True
 
 
-class IdempotencePolicy(BaseModel):
+class IdempotencePolicy(SpecModel):
     required: bool = True
     allowed_changes: Optional[List[NonEmptyStr]] = None
     enforcement: Optional[IdempotenceEnforcement] = None
@@ -86,7 +97,7 @@ class IdempotencePolicy(BaseModel):
 # Vault
 # -------------------------
 
-class VaultSpec(BaseModel):
+class VaultSpec(SpecModel):
     vault_password: NonEmptyStr
     vault_ids: Optional[List[NonEmptyStr]] = None
     vaulted_vars_files: List[NonEmptyStr]
@@ -98,7 +109,7 @@ class VaultSpec(BaseModel):
 # Failure policy
 # -------------------------
 
-class FailurePolicy(BaseModel):
+class FailurePolicy(SpecModel):
     """Policy for handling expected failures during converge."""
     allow_failures: bool = False
     max_failures: Optional[int] = None
@@ -109,7 +120,7 @@ class FailurePolicy(BaseModel):
 # Reboot configuration
 # -------------------------
 
-class RebootConfig(BaseModel):
+class RebootConfig(SpecModel):
     """Configuration for rebooting nodes after converge, before tests."""
     enabled: bool = False
     nodes: Optional[List[SafeIdentifier]] = None
@@ -121,7 +132,7 @@ class RebootConfig(BaseModel):
 # Phase overlays
 # -------------------------
 
-class PhaseOverlay(BaseModel):
+class PhaseOverlay(SpecModel):
     inventory_vars: Optional[Dict[str, Any]] = None
     group_vars: Optional[Dict[str, Dict[str, Any]]] = None
     host_vars: Optional[Dict[str, Dict[str, Any]]] = None
@@ -130,6 +141,6 @@ class PhaseOverlay(BaseModel):
     failure_policy: Optional[FailurePolicy] = None
 
 
-class PhaseOverlays(BaseModel):
+class PhaseOverlays(SpecModel):
     baseline: Optional[PhaseOverlay] = None
     mutation: Optional[PhaseOverlay] = None
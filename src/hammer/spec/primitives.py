@@ -1,8 +1,46 @@
 """Common type aliases and primitives for HAMMER spec models."""
 
-from typing import Literal
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Discriminator, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
+from typing_extensions import Self
+
+
+class SpecModel(BaseModel):
+    """
+    Base for all spec models.
+
+    Loaded specs are cached and shared between callers, so their models
+    are frozen: a field assignment raises instead of leaking into every
+    other holder of the same spec.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        """
+        Copy the model, dropping values cached by ``cached_property``.
+
+        Cached properties live in the instance ``__dict__`` next to the
+        fields, so a copy would otherwise keep values derived from the
+        original fields.
+
+        Args:
+            update: Field values to change in the copy
+            deep: Whether to deep-copy the field values
+
+        Returns:
+            The copied model
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for key in copied.__dict__.keys() - type(copied).model_fields.keys():
+            del copied.__dict__[key]
+        return copied
 
-from pydantic import BaseModel
 
 NonEmptyStr = str  # Kept for fields where strict validation is not needed
 
@@ -33,8 +71,63 @@ ReachabilityExpectation = Literal["reachable", "not_reachable"]
 
 Protocol = Literal["tcp", "udp"]
 
+HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "HEAD"]
+
+
+class _KeyDiscriminator(Discriminator):
+    """
+    Discriminator whose JSON schema stays a plain ``anyOf``.
+
+    Pydantic renders discriminated unions as ``oneOf``, but our members are
+    open objects told apart only by an extra key (a FilePatternTarget also
+    matches FilePathTarget), so ``oneOf`` would reject valid specs.
+    """
+
+    def __get_pydantic_json_schema__(
+        self, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        if "oneOf" in json_schema:
+            json_schema["anyOf"] = json_schema.pop("oneOf")
+        return json_schema
+
+
+def key_discriminator(*keys: str, default: Optional[str] = None) -> Discriminator:
+    """
+    Build a union discriminator that picks the member by its identifying key.
+
+    Spec YAML has no explicit type tags, but each member of our unions has
+    a key no other member uses. Members are tagged (``Tag``) with that key,
+    so Pydantic validates against one member instead of trying them all.
+
+    Args:
+        keys: Identifying keys, checked in order
+        default: Tag for inputs carrying none of the keys
+
+    Returns:
+        Discriminator for use in ``Annotated[Union[...], ...]``
+    """
+    def discriminate(value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            present = value
+        elif isinstance(value, BaseModel):
+            present = type(value).model_fields
+        else:
+            return default
+        for key in keys:
+            if key in present:
+                return key
+        return default
+
+    expected = ", ".join(keys)
+    return _KeyDiscriminator(
+        discriminate,
+        custom_error_type="union_tag_missing",
+        custom_error_message=f"Expected one of the keys: {expected}",
+    )
+
 
-class FeatureFlags(BaseModel):
+class FeatureFlags(SpecModel):
     vault: bool = False
     selinux: bool = False
     handlers: bool = True
@@ -1,12 +1,14 @@
 """Root HammerSpec model and loader."""
 
-from typing import Any, List, Optional, Literal
+import functools
+import itertools
+import os
+from typing import Any, Dict, Iterator, List, Optional, Literal
 from pathlib import Path
 
-import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, ValidationInfo, model_validator
 
-from hammer.spec.primitives import NonEmptyStr, FeatureFlags
+from hammer.spec.primitives import SpecModel, NonEmptyStr, FeatureFlags
 from hammer.spec.topology import Topology
 from hammer.spec.entrypoints import Entrypoints
 from hammer.spec.variables import VariableContract, PrecedenceScenario
@@ -25,7 +27,7 @@ from hammer.spec.overlays import (
 from hammer.validators import SafeIdentifier
 
 
-class HammerSpec(BaseModel):
+class HammerSpec(SpecModel):
     assignment_id: SafeIdentifier
     assignment_version: NonEmptyStr
     spec_version: Literal["1.0"]
@@ -56,189 +58,256 @@ class HammerSpec(BaseModel):
     # Cross-field validation
     # -------------------------
 
-    @model_validator(mode="after")
-    def semantic_validation(self) -> "HammerSpec":
+    @classmethod
+    def from_trusted(cls, data: Any) -> "HammerSpec":
+        """
+        Rebuild a spec from data that has already passed validation.
 
-        var_names = {v.name for v in (self.variable_contracts or [])}
+        Field validators still run; the cross-field semantic pass is skipped.
 
-        # Validate precedence variable references
-        if self.precedence_scenarios:
-            for scen in self.precedence_scenarios:
-                if scen.variable not in var_names:
-                    raise ValueError(
-                        f"Precedence scenario references unknown variable '{scen.variable}'"
-                    )
+        Args:
+            data: Spec data, e.g. from model_dump() or a validated YAML file
 
-        # Validate binding index references
-        for idx, var in enumerate(self.variable_contracts or []):
-            for scen in self.precedence_scenarios or []:
-                if scen.variable == var.name:
-                    for b in scen.bindings_to_verify:
-                        if b < 0 or b >= len(var.binding_targets):
-                            raise ValueError(
-                                f"bindings_to_verify index {b} out of range for variable '{var.name}'"
-                            )
-
-        # Feature gating
-        if self.handler_contracts and not self.features.handlers:
-            raise ValueError("Handler contracts present but features.handlers is false")
-
-        if self.vault and not self.features.vault:
-            raise ValueError("Vault spec present but features.vault is false")
-
-        if self.behavioral_contracts and self.behavioral_contracts.reachability:
-            if not self.features.reachability:
+        Returns:
+            The HammerSpec
+        """
+        return cls.model_validate(data, context={"trusted": True})
+
+    @model_validator(mode="after")
+    def semantic_validation(self, info: ValidationInfo) -> "HammerSpec":
+        # Specs that already passed a full load skip the cross-field pass
+        if not (info.context and info.context.get("trusted")):
+            validate_semantics(self)
+        return self
+
+
+def _overlay_mappings(overlays: PhaseOverlays) -> Iterator[Dict[str, Any]]:
+    """Yield every variable mapping set by the baseline and mutation overlays."""
+    for phase in (overlays.baseline, overlays.mutation):
+        if not phase:
+            continue
+        if phase.inventory_vars:
+            yield phase.inventory_vars
+        if phase.extra_vars:
+            yield phase.extra_vars
+        if phase.group_vars:
+            yield from phase.group_vars.values()
+        if phase.host_vars:
+            yield from phase.host_vars.values()
+
+
+def validate_semantics(spec: HammerSpec) -> None:
+    """
+    Run the cross-field checks on a spec whose fields are already valid.
+
+    HammerSpec runs this automatically on validation unless the spec is
+    loaded as trusted; call it directly to check a trusted spec later.
+
+    Args:
+        spec: The spec to check
+
+    Raises:
+        ValueError: If the spec references unknown variables, nodes or
+            groups, or uses a feature that is not enabled
+    """
+    var_by_name = {v.name: v for v in (spec.variable_contracts or [])}
+    var_names = var_by_name.keys()
+
+    # Validate precedence variable and binding index references
+    for scen in spec.precedence_scenarios or []:
+        var = var_by_name.get(scen.variable)
+        if var is None:
+            raise ValueError(
+                f"Precedence scenario references unknown variable '{scen.variable}'"
+            )
+        binding_count = len(var.binding_targets)
+        for b in scen.bindings_to_verify:
+            if b < 0 or b >= binding_count:
                 raise ValueError(
-                    "Reachability contracts present but features.reachability is false"
+                    f"bindings_to_verify index {b} out of range for variable '{var.name}'"
                 )
 
-        # Phase overlay sanity
-        if self.variable_contracts and not self.phase_overlays.baseline:
-            raise ValueError("Baseline phase_overlays must be defined when variable_contracts exist")
-
-        # Variable overlay coverage
-        overlay_vars = set()
-        for phase in [self.phase_overlays.baseline, self.phase_overlays.mutation]:
-            if phase:
-                for src in [phase.inventory_vars, phase.extra_vars]:
-                    if src:
-                        overlay_vars |= set(src.keys())
-                if phase.group_vars:
-                    for gvars in phase.group_vars.values():
-                        overlay_vars |= set(gvars.keys())
-                if phase.host_vars:
-                    for hvars in phase.host_vars.values():
-                        overlay_vars |= set(hvars.keys())
-
-        for var in (self.variable_contracts or []):
-            if var.name not in overlay_vars:
-                if len(var.binding_targets) > 0:
-                    raise ValueError(
-                        f"Variable '{var.name}' has bindings but is never set in phase_overlays"
-                    )
+    # Feature gating
+    if spec.handler_contracts and not spec.features.handlers:
+        raise ValueError("Handler contracts present but features.handlers is false")
+
+    if spec.vault and not spec.features.vault:
+        raise ValueError("Vault spec present but features.vault is false")
+
+    if spec.behavioral_contracts and spec.behavioral_contracts.reachability:
+        if not spec.features.reachability:
+            raise ValueError(
+                "Reachability contracts present but features.reachability is false"
+            )
+
+    # Phase overlay sanity
+    if spec.variable_contracts and not spec.phase_overlays.baseline:
+        raise ValueError("Baseline phase_overlays must be defined when variable_contracts exist")
+
+    # Variable overlay coverage: strike off bound variables as overlays set them
+    uncovered = {v.name for v in (spec.variable_contracts or []) if v.has_bindings}
+    if uncovered:
+        for mapping in _overlay_mappings(spec.phase_overlays):
+            uncovered.difference_update(mapping)
+            if not uncovered:
+                break
+
+    for var in (spec.variable_contracts or []):
+        if var.name in uncovered:
+            raise ValueError(
+                f"Variable '{var.name}' has bindings but is never set in phase_overlays"
+            )
+
+    # Node existence validation
+    node_names = spec.topology.node_names
+    group_names = spec.topology.group_names
+
+    # Check every selector in spec order, so the first offender is reported
+    bcs = spec.behavioral_contracts
+    selectors: List[NodeSelector] = []
+    if bcs:
+        selectors.extend(
+            bc.node_selector
+            for bc in itertools.chain(
+                bcs.packages or (),
+                bcs.pip_packages or (),
+                bcs.services or (),
+                bcs.users or (),
+                bcs.groups or (),
+                bcs.firewall or (),
+                bcs.files or (),
+                bcs.http_endpoints or (),
+            )
+        )
+        selectors.extend(
+            ext.from_node for ext in bcs.external_http or () if ext.from_node
+        )
+    selectors.extend(hc.node_selector for hc in spec.handler_contracts or ())
+
+    for sel in selectors:
+        if sel.host and sel.host not in node_names:
+            raise ValueError(f"Unknown host in selector: {sel.host}")
+        if sel.group and sel.group not in group_names:
+            raise ValueError(f"Unknown group in selector: {sel.group}")
+
+    # Validate reboot node references
+    for phase_name, phase_overlay in (
+        ("baseline", spec.phase_overlays.baseline),
+        ("mutation", spec.phase_overlays.mutation),
+    ):
+        if phase_overlay and phase_overlay.reboot and phase_overlay.reboot.nodes:
+            reboot_nodes = phase_overlay.reboot.nodes
+            if not node_names.issuperset(reboot_nodes):
+                node = next(n for n in reboot_nodes if n not in node_names)
+                raise ValueError(
+                    f"Reboot config in {phase_name} references unknown node '{node}'"
+                )
 
-        # Node existence validation
-        node_names = {n.name for n in self.topology.nodes}
-        group_names = set()
-        for n in self.topology.nodes:
-            for g in n.groups:
-                group_names.add(g)
-
-        def check_selector(sel: NodeSelector) -> None:
-            if sel.host and sel.host not in node_names:
-                raise ValueError(f"Unknown host in selector: {sel.host}")
-            if sel.group and sel.group not in group_names:
-                raise ValueError(f"Unknown group in selector: {sel.group}")
-
-        all_bcs: List[Any] = []
-        if self.behavioral_contracts:
-            all_bcs.extend(self.behavioral_contracts.packages or [])
-            all_bcs.extend(self.behavioral_contracts.pip_packages or [])
-            all_bcs.extend(self.behavioral_contracts.services or [])
-            all_bcs.extend(self.behavioral_contracts.users or [])
-            all_bcs.extend(self.behavioral_contracts.groups or [])
-            all_bcs.extend(self.behavioral_contracts.firewall or [])
-            all_bcs.extend(self.behavioral_contracts.files or [])
-            all_bcs.extend(self.behavioral_contracts.http_endpoints or [])
-
-        for bc in all_bcs:
-            check_selector(bc.node_selector)
-
-        # Validate external_http from_node references
-        if self.behavioral_contracts and self.behavioral_contracts.external_http:
-            for ext in self.behavioral_contracts.external_http:
-                if ext.from_node:
-                    check_selector(ext.from_node)
-
-        for hc in self.handler_contracts or []:
-            check_selector(hc.node_selector)
-
-        # Validate reboot node references
-        for phase_name in ["baseline", "mutation"]:
-            phase_overlay = getattr(self.phase_overlays, phase_name, None)
-            if phase_overlay and phase_overlay.reboot and phase_overlay.reboot.nodes:
-                for node in phase_overlay.reboot.nodes:
-                    if node not in node_names:
-                        raise ValueError(
-                            f"Reboot config in {phase_name} references unknown node '{node}'"
-                        )
-
-        # Validate overlay target references
-        for var in (self.variable_contracts or []):
-            for target in var.grading_overlay_targets:
-                if target.overlay_kind == "group_vars":
-                    if target.target_name not in group_names and target.target_name != "all":
-                        raise ValueError(
-                            f"Variable '{var.name}' overlay targets unknown group '{target.target_name}'"
-                        )
-                elif target.overlay_kind == "host_vars":
-                    if target.target_name not in node_names:
-                        raise ValueError(
-                            f"Variable '{var.name}' overlay targets unknown host '{target.target_name}'"
-                        )
-
-        # Validate PortRefVar references in behavioral contracts
-        def check_port_ref(port_ref, context: str) -> None:
-            if isinstance(port_ref, PortRefVar):
-                if port_ref.var not in var_names:
+    # Validate overlay target references in spec order
+    for var in (spec.variable_contracts or []):
+        for target in var.grading_overlay_targets:
+            name = target.target_name
+            if target.overlay_kind == "group_vars":
+                if name not in group_names and name != "all":
                     raise ValueError(
-                        f"{context}: references undefined variable '{port_ref.var}'"
+                        f"Variable '{var.name}' overlay targets unknown group '{name}'"
                     )
-            elif isinstance(port_ref, dict) and "var" in port_ref:
-                if port_ref["var"] not in var_names:
+            elif target.overlay_kind == "host_vars":
+                if name not in node_names:
                     raise ValueError(
-                        f"{context}: references undefined variable '{port_ref['var']}'"
+                        f"Variable '{var.name}' overlay targets unknown host '{name}'"
                     )
 
-        if self.behavioral_contracts:
-            for fw in self.behavioral_contracts.firewall or []:
-                for port_spec in fw.open_ports:
-                    check_port_ref(port_spec.port, "Firewall contract")
+    # Validate PortRefVar references in behavioral contracts
+    def check_port_ref(port_ref, context: str) -> None:
+        if type(port_ref) is PortRefVar and port_ref.var not in var_names:
+            raise ValueError(
+                f"{context}: references undefined variable '{port_ref.var}'"
+            )
+
+    if spec.behavioral_contracts:
+        for fw in spec.behavioral_contracts.firewall or []:
+            for port_spec in fw.open_ports:
+                check_port_ref(port_spec.port, "Firewall contract")
+
+        for reach in spec.behavioral_contracts.reachability or []:
+            check_port_ref(reach.port, "Reachability contract")
+            if reach.from_host not in node_names:
+                raise ValueError(
+                    f"Reachability contract references unknown from_host '{reach.from_host}'"
+                )
+            if reach.to_host not in node_names:
+                raise ValueError(
+                    f"Reachability contract references unknown to_host '{reach.to_host}'"
+                )
 
-            for reach in self.behavioral_contracts.reachability or []:
-                check_port_ref(reach.port, "Reachability contract")
-                if reach.from_host not in node_names:
-                    raise ValueError(
-                        f"Reachability contract references unknown from_host '{reach.from_host}'"
-                    )
-                if reach.to_host not in node_names:
-                    raise ValueError(
-                        f"Reachability contract references unknown to_host '{reach.to_host}'"
-                    )
+    # Validate topology dependency references; only walk them one by one
+    # to name the offender once the set check has failed
+    deps = spec.topology.dependencies
+    if deps and not node_names.issuperset(
+        itertools.chain.from_iterable((dep.from_host, dep.to_host) for dep in deps)
+    ):
+        for dep in deps:
+            if dep.from_host not in node_names:
+                raise ValueError(
+                    f"Dependency references unknown from_host '{dep.from_host}'"
+                )
+            if dep.to_host not in node_names:
+                raise ValueError(
+                    f"Dependency references unknown to_host '{dep.to_host}'"
+                )
 
-        # Validate topology dependency references
-        if self.topology.dependencies:
-            for dep in self.topology.dependencies:
-                if dep.from_host not in node_names:
-                    raise ValueError(
-                        f"Dependency references unknown from_host '{dep.from_host}'"
-                    )
-                if dep.to_host not in node_names:
+    # Validate handler trigger variable references
+    for hc in spec.handler_contracts or []:
+        for trigger in hc.trigger_conditions:
+            if type(trigger) is TriggerVariableChanged:
+                if trigger.variable_changed not in var_names:
                     raise ValueError(
-                        f"Dependency references unknown to_host '{dep.to_host}'"
+                        f"Handler '{hc.handler_name}' trigger references "
+                        f"undefined variable '{trigger.variable_changed}'"
                     )
 
-        # Validate handler trigger variable references
-        for hc in self.handler_contracts or []:
-            for trigger in hc.trigger_conditions:
-                if isinstance(trigger, TriggerVariableChanged):
-                    if trigger.variable_changed not in var_names:
-                        raise ValueError(
-                            f"Handler '{hc.handler_name}' trigger references "
-                            f"undefined variable '{trigger.variable_changed}'"
-                        )
-                elif hasattr(trigger, "variable_changed"):
-                    if trigger.variable_changed not in var_names:
-                        raise ValueError(
-                            f"Handler '{hc.handler_name}' trigger references "
-                            f"undefined variable '{trigger.variable_changed}'"
-                        )
 
-        return self
+@functools.lru_cache(maxsize=1)
+def spec_json_schema() -> Dict[str, Any]:
+    """
+    Return the JSON schema for HammerSpec, generated once per process.
+
+    The returned dict is shared; callers must not mutate it.
+    """
+    return HammerSpec.model_json_schema()
+
+
+def load_spec_from_file(path: Path, trusted: bool = False) -> HammerSpec:
+    """
+    Load and validate a Hammer spec from a YAML file.
+
+    Loaded specs are cached by (path, mtime, size), so reloading an
+    unchanged file returns the same HammerSpec instance; callers must
+    treat it as read-only.
+
+    Args:
+        path: Path to the spec YAML file
+        trusted: Skip the cross-field semantic checks for a spec that has
+            already been validated. Field-level validation still runs.
+
+    Returns:
+        The validated HammerSpec
+    """
+    st = os.stat(path)
+    return _load_spec_cached(str(path), st.st_mtime_ns, st.st_size, trusted)
+
 
+@functools.lru_cache(maxsize=16)
+def _load_spec_cached(path: str, mtime_ns: int, size: int, trusted: bool) -> HammerSpec:
+    """Parse and validate a spec file; keyed on its stat so edits invalidate."""
+    # Imported here so importing the models does not pay for PyYAML
+    import yaml
 
-def load_spec_from_file(path: Path) -> HammerSpec:
-    """Load and validate a Hammer spec from a YAML file."""
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        data = yaml.load(f.read(), Loader=loader)
+    if trusted:
+        return HammerSpec.from_trusted(data)
     return HammerSpec.model_validate(data)
@@ -1,46 +1,67 @@
 """Topology models for HAMMER spec."""
 
-from typing import List, Optional, Literal
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional, Literal, Tuple
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
 from hammer.validators import SafeIdentifier, SafeDomain
-from hammer.spec.primitives import Protocol
+from hammer.spec.primitives import SpecModel, Protocol
 
 
-class NodeResources(BaseModel):
+class NodeResources(SpecModel):
     cpu: int = Field(ge=1, le=64)
     ram_mb: int = Field(ge=256, le=262144)
 
 
-class ForwardedPort(BaseModel):
+class ForwardedPort(SpecModel):
     host_port: int = Field(ge=1, le=65535)
     guest_port: int = Field(ge=1, le=65535)
     protocol: Protocol
 
 
-class Node(BaseModel):
+class Node(SpecModel):
     name: SafeIdentifier
     groups: List[SafeIdentifier]
     resources: NodeResources
     forwarded_ports: Optional[List[ForwardedPort]] = None
 
 
-class Dependency(BaseModel):
+class Dependency(SpecModel):
     from_host: SafeIdentifier
     to_host: SafeIdentifier
     kind: Literal["reachability", "ordering"]
 
 
-class Topology(BaseModel):
+class Topology(SpecModel):
     domain: Optional[SafeDomain] = None
     nodes: List[Node]
     forwarded_ports: Optional[List[ForwardedPort]] = None
     dependencies: Optional[List[Dependency]] = None
 
+    @cached_property
+    def node_names(self) -> FrozenSet[str]:
+        """Names of all nodes in the topology."""
+        return frozenset(n.name for n in self.nodes)
+
+    @cached_property
+    def group_members(self) -> Dict[str, Tuple[str, ...]]:
+        """Node names in each group, in topology order."""
+        members: Dict[str, List[str]] = {}
+        for n in self.nodes:
+            for g in n.groups:
+                names = members.setdefault(g, [])
+                if not names or names[-1] != n.name:  # node lists a group twice
+                    names.append(n.name)
+        return {g: tuple(names) for g, names in members.items()}
+
+    @cached_property
+    def group_names(self) -> FrozenSet[str]:
+        """Names of all groups any node belongs to."""
+        return frozenset(self.group_members)
+
     @model_validator(mode="after")
     def unique_node_names(self) -> "Topology":
-        names = [n.name for n in self.nodes]
-        if len(names) != len(set(names)):
+        if len(self.node_names) != len(self.nodes):
             raise ValueError("Duplicate node names in topology")
         return self
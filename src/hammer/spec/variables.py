@@ -1,11 +1,12 @@
 """Variable contract and binding models for HAMMER spec."""
 
-from typing import Any, List, Optional, Union, Literal
+from typing import Annotated, Any, List, Optional, Union, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, Tag, model_validator
 
 from hammer.validators import SafeIdentifier, SafePath, SafePattern, SafeZone
 from hammer.spec.primitives import (
+    SpecModel,
     NonEmptyStr,
     PhaseName,
     VarType,
@@ -13,6 +14,7 @@ from hammer.spec.primitives import (
     BindingMode,
     PrecedenceLayer,
     Protocol,
+    key_discriminator,
 )
 
 
@@ -20,48 +22,51 @@ from hammer.spec.primitives import (
 # Variable bindings
 # -------------------------
 
-class ServiceListenTarget(BaseModel):
+class ServiceListenTarget(SpecModel):
     service: SafeIdentifier
     protocol: Protocol
     address: NonEmptyStr
 
 
-class FirewallPortTarget(BaseModel):
+class FirewallPortTarget(SpecModel):
     zone: SafeZone
     protocol: Protocol
 
 
-class FilePatternTarget(BaseModel):
+class FilePatternTarget(SpecModel):
     path: SafePath
     pattern: SafePattern
 
 
-class FilePathTarget(BaseModel):
+class FilePathTarget(SpecModel):
     path: SafePath
 
 
-class FileModeTarget(BaseModel):
+class FileModeTarget(SpecModel):
     path: SafePath
     mode: NonEmptyStr
 
 
-class FileOwnerTarget(BaseModel):
+class FileOwnerTarget(SpecModel):
     path: SafePath
     owner: SafeIdentifier
     group: SafeIdentifier
 
 
-BindingTarget = Union[
-    ServiceListenTarget,
-    FirewallPortTarget,
-    FilePatternTarget,
-    FilePathTarget,
-    FileModeTarget,
-    FileOwnerTarget,
+BindingTarget = Annotated[
+    Union[
+        Annotated[ServiceListenTarget, Tag("service")],
+        Annotated[FirewallPortTarget, Tag("zone")],
+        Annotated[FilePatternTarget, Tag("pattern")],
+        Annotated[FilePathTarget, Tag("path")],
+        Annotated[FileModeTarget, Tag("mode")],
+        Annotated[FileOwnerTarget, Tag("owner")],
+    ],
+    key_discriminator("service", "zone", "pattern", "mode", "owner", default="path"),
 ]
 
 
-class Binding(BaseModel):
+class Binding(SpecModel):
     type: Literal[
         "service_listen_port",
         "firewall_port_open",
@@ -75,16 +80,16 @@ class Binding(BaseModel):
     weight: float = Field(default=1.0, ge=0.0)
 
 
-class OverlayTarget(BaseModel):
+class OverlayTarget(SpecModel):
     overlay_kind: OverlayKind
     target_name: SafeIdentifier
 
 
-class VariableDefaults(BaseModel):
+class VariableDefaults(SpecModel):
     student: Any
 
 
-class VariableContract(BaseModel):
+class VariableContract(SpecModel):
     name: SafeIdentifier
     type: VarType
     defaults: VariableDefaults
@@ -93,9 +98,14 @@ class VariableContract(BaseModel):
     binding_targets: List[Binding]
     bindings_mode: BindingMode = "all"
 
+    @property
+    def has_bindings(self) -> bool:
+        """Whether the variable declares any binding targets."""
+        return bool(self.binding_targets)
+
     @model_validator(mode="after")
     def validate_variable_contract(self) -> "VariableContract":
-        if self.binding_targets and len(self.allowed_values) < 2:
+        if self.has_bindings and len(self.allowed_values) < 2:
             raise ValueError(
                 f"Variable '{self.name}' has bindings but less than 2 allowed_values"
             )
@@ -112,7 +122,7 @@ class VariableContract(BaseModel):
 # Precedence scenarios
 # -------------------------
 
-class PrecedenceScenario(BaseModel):
+class PrecedenceScenario(SpecModel):
     name: SafeIdentifier
     variable: SafeIdentifier
     layers: List[PrecedenceLayer]
@@ -3,10 +3,11 @@
 Generates pytest/testinfra test files from execution plans.
 """
 
+import functools
 from pathlib import Path
 from typing import Any, Dict, List
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from hammer.spec import HammerSpec
 from hammer.plan import ExecutionPlan, ExecutionPhaseName
@@ -49,16 +50,24 @@ def _pyescape(value: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_env() -> Environment:
-    """Get Jinja2 environment with templates."""
+    """Get Jinja2 environment with templates, shared for the process."""
     env = Environment(
         loader=FileSystemLoader(TEMPLATES_DIR),
         keep_trailing_newline=True,
+        auto_reload=False,
     )
     env.filters["pyescape"] = _pyescape
     return env
 
 
+@functools.lru_cache(maxsize=None)
+def _get_template(name: str) -> Template:
+    """Get a compiled test template by name."""
+    return _get_env().get_template(name)
+
+
 def _get_resolved_vars(plan: ExecutionPlan, phase: ExecutionPhaseName) -> Dict[str, Any]:
     """Get resolved variable values for a phase."""
     phase_vars = plan.variables[phase]
@@ -88,14 +97,13 @@ def generate_tests(
     Returns:
         List of generated test file paths
     """
-    env = _get_env()
     generated_files: List[Path] = []
 
     tests_dir = output_dir / "tests"
     tests_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate conftest.py (shared across phases)
-    conftest_content = _render_conftest(env, spec, network)
+    conftest_content = _render_conftest(spec, network)
     conftest_path = tests_dir / "conftest.py"
     conftest_path.write_text(conftest_content)
     generated_files.append(conftest_path)
@@ -111,7 +119,7 @@ def generate_tests(
         generated_files.append(init_path)
 
         phase_files = _generate_phase_tests(
-            env, spec, plan, network, phase, phase_dir
+            spec, plan, network, phase, phase_dir
         )
         generated_files.extend(phase_files)
 
@@ -119,13 +127,11 @@ def generate_tests(
 
 
 def _render_conftest(
-    env: Environment,
     spec: HammerSpec,
     network: NetworkPlan,
 ) -> str:
     """Render the conftest.py file."""
-    template = env.get_template("conftest.py.j2")
-    return template.render(
+    return _get_template("conftest.py.j2").render(
         assignment_id=spec.assignment_id,
         phase="all",
         nodes=spec.topology.nodes,
@@ -134,7 +140,6 @@ def _render_conftest(
 
 
 def _generate_phase_tests(
-    env: Environment,
     spec: HammerSpec,
     plan: ExecutionPlan,
     network: NetworkPlan,
@@ -150,7 +155,7 @@ def _generate_phase_tests(
     if spec.variable_contracts:
         binding_tests = generate_binding_tests(spec, contract, phase)
         if binding_tests:
-            content = env.get_template("test_bindings.py.j2").render(
+            content = _get_template("test_bindings.py.j2").render(
                 assignment_id=spec.assignment_id,
                 phase=phase,
                 tests=binding_tests,
@@ -162,7 +167,7 @@ def _generate_phase_tests(
     # Package tests
     package_tests = generate_package_tests(contract)
     if package_tests:
-        content = env.get_template("test_packages.py.j2").render(
+        content = _get_template("test_packages.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=package_tests,
@@ -174,7 +179,7 @@ def _generate_phase_tests(
     # Pip package tests
     pip_package_tests = generate_pip_package_tests(contract)
     if pip_package_tests:
-        content = env.get_template("test_pip_packages.py.j2").render(
+        content = _get_template("test_pip_packages.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=pip_package_tests,
@@ -186,7 +191,7 @@ def _generate_phase_tests(
     # Service tests
     service_tests = generate_service_tests(contract)
     if service_tests:
-        content = env.get_template("test_services.py.j2").render(
+        content = _get_template("test_services.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=service_tests,
@@ -198,7 +203,7 @@ def _generate_phase_tests(
     # User tests
     user_tests = generate_user_tests(contract)
     if user_tests:
-        content = env.get_template("test_users.py.j2").render(
+        content = _get_template("test_users.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=user_tests,
@@ -210,7 +215,7 @@ def _generate_phase_tests(
     # Group tests
     group_tests = generate_group_tests(contract)
     if group_tests:
-        content = env.get_template("test_groups.py.j2").render(
+        content = _get_template("test_groups.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=group_tests,
@@ -222,7 +227,7 @@ def _generate_phase_tests(
     # File tests
     file_tests = generate_file_tests(contract)
     if file_tests:
-        content = env.get_template("test_files.py.j2").render(
+        content = _get_template("test_files.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=file_tests,
@@ -234,7 +239,7 @@ def _generate_phase_tests(
     # Firewall tests
     firewall_tests = generate_firewall_tests(contract, resolved_vars)
     if firewall_tests:
-        content = env.get_template("test_firewall.py.j2").render(
+        content = _get_template("test_firewall.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=firewall_tests,
@@ -246,7 +251,7 @@ def _generate_phase_tests(
     # Reachability tests
     reachability_tests = generate_reachability_tests(contract, resolved_vars)
     if reachability_tests:
-        content = env.get_template("test_reachability.py.j2").render(
+        content = _get_template("test_reachability.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=reachability_tests,
@@ -258,7 +263,7 @@ def _generate_phase_tests(
     # HTTP endpoint tests
     http_endpoint_tests = generate_http_endpoint_tests(contract, resolved_vars)
     if http_endpoint_tests:
-        content = env.get_template("test_http.py.j2").render(
+        content = _get_template("test_http.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=http_endpoint_tests,
@@ -272,7 +277,7 @@ def _generate_phase_tests(
 
     # Host-based external HTTP tests
     if external_http_tests["host_tests"]:
-        content = env.get_template("test_external_http_host.py.j2").render(
+        content = _get_template("test_external_http_host.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=external_http_tests["host_tests"],
@@ -283,7 +288,7 @@ def _generate_phase_tests(
 
     # VM-based external HTTP tests
     if external_http_tests["vm_tests"]:
-        content = env.get_template("test_external_http_vm.py.j2").render(
+        content = _get_template("test_external_http_vm.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=external_http_tests["vm_tests"],
@@ -295,7 +300,7 @@ def _generate_phase_tests(
     # Handler tests
     handler_tests = generate_handler_tests(contract)
     if handler_tests:
-        content = env.get_template("test_handlers.py.j2").render(
+        content = _get_template("test_handlers.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             handlers=handler_tests,
@@ -307,7 +312,7 @@ def _generate_phase_tests(
     # Output pattern tests (Ansible debug messages, etc.)
     output_tests = generate_output_tests(contract)
     if output_tests:
-        content = env.get_template("test_output.py.j2").render(
+        content = _get_template("test_output.py.j2").render(
             assignment_id=spec.assignment_id,
             phase=phase,
             tests=output_tests,
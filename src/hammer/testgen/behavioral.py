@@ -3,6 +3,7 @@
 Generates tests for packages, services, files, and firewall.
 """
 
+import re
 from typing import Any, Dict, List
 
 from hammer.plan import (
@@ -20,59 +21,54 @@ from hammer.plan import (
 from hammer.testgen.utils import make_safe_name, resolve_port
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([\w-]+)\s*\}\}")
+
+
 def generate_package_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
     """Generate test data for package checks."""
-    tests = []
-
-    for pkg in contract.packages:
-        tests.append({
+    return [
+        {
             "name": pkg.name,
             "state": pkg.state,
             "hosts": pkg.host_targets,
             "weight": pkg.weight,
-        })
-
-    return tests
+        }
+        for pkg in contract.packages
+    ]
 
 
 def generate_pip_package_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
     """Generate test data for pip package checks."""
-    tests = []
-
-    for pkg in contract.pip_packages:
-        tests.append({
+    return [
+        {
             "name": pkg.name,
             "state": pkg.state,
             "python": pkg.python,
             "hosts": pkg.host_targets,
             "weight": pkg.weight,
-        })
-
-    return tests
+        }
+        for pkg in contract.pip_packages
+    ]
 
 
 def generate_service_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
     """Generate test data for service checks."""
-    tests = []
-
-    for svc in contract.services:
-        tests.append({
+    return [
+        {
             "name": svc.name,
             "enabled": svc.enabled,
             "running": svc.running,
             "hosts": svc.host_targets,
             "weight": svc.weight,
-        })
-
-    return tests
+        }
+        for svc in contract.services
+    ]
 
 
 def generate_user_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
     """Generate test data for user checks."""
-    tests = []
-
-    for user in contract.users:
-        tests.append({
+    return [
+        {
             "name": user.name,
             "exists": user.exists,
             "uid": user.uid,
@@ -82,25 +78,23 @@ def generate_user_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
             "groups": user.groups,
             "hosts": user.host_targets,
             "weight": user.weight,
-        })
-
-    return tests
+        }
+        for user in contract.users
+    ]
 
 
 def generate_group_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
     """Generate test data for group checks."""
-    tests = []
-
-    for group in contract.groups:
-        tests.append({
+    return [
+        {
             "name": group.name,
             "exists": group.exists,
             "gid": group.gid,
             "hosts": group.host_targets,
             "weight": group.weight,
-        })
-
-    return tests
+        }
+        for group in contract.groups
+    ]
 
 
 def generate_file_tests(contract: PhaseContractPlan) -> List[Dict[str, Any]]:
@@ -147,43 +141,36 @@ def generate_firewall_tests(
         contract: The phase contract plan
         resolved_vars: Resolved variable values for port references
     """
-    tests = []
-
-    for fw in contract.firewall:
-        ports = []
-        for port_spec in fw.ports:
-            port_val = port_spec.get("port")
-            port_val = resolve_port(port_val, resolved_vars)
-
-            ports.append({
-                "port": port_val,
-                "protocol": port_spec.get("protocol", "tcp"),
-                "zone": port_spec.get("zone", "public"),
-            })
-
-        tests.append({
+    return [
+        {
             "hosts": fw.host_targets,
-            "ports": ports,
+            "ports": [
+                {
+                    "port": resolve_port(port_spec.get("port"), resolved_vars),
+                    "protocol": port_spec.get("protocol", "tcp"),
+                    "zone": port_spec.get("zone", "public"),
+                }
+                for port_spec in fw.ports
+            ],
             "firewall_type": fw.firewall_type,
             "weight": fw.weight,
-        })
-
-    return tests
+        }
+        for fw in contract.firewall
+    ]
 
 
 def _interpolate_vars(s: str, resolved_vars: Dict[str, Any]) -> str:
     """Interpolate {{ var }} placeholders in a string."""
-    if not s:
+    if not s or "{{" not in s:
         return s
-    
-    result = s
-    for name, val in resolved_vars.items():
-        placeholder = "{{" + f" {name} " + "}}"
-        placeholder_no_space = "{{" + name + "}}"
-        result = result.replace(placeholder, str(val))
-        result = result.replace(placeholder_no_space, str(val))
-    
-    return result
+
+    def _substitute(match: re.Match) -> str:
+        name = match.group(1)
+        if name in resolved_vars:
+            return str(resolved_vars[name])
+        return match.group(0)
+
+    return _PLACEHOLDER_RE.sub(_substitute, s)
 
 
 def generate_http_endpoint_tests(
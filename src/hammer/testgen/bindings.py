@@ -3,10 +3,10 @@
 Generates tests that verify variable bindings are correctly applied.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from hammer.plan import BindingCheck, PhaseContractPlan
-from hammer.spec import HammerSpec
+from hammer.plan import PhaseContractPlan
+from hammer.spec import HammerSpec, VariableContract
 from hammer.testgen.utils import make_safe_name
 
 
@@ -32,6 +32,8 @@ def generate_binding_tests(
     if not spec.variable_contracts:
         return tests
 
+    var_contracts = {vc.name: vc for vc in spec.variable_contracts}
+
     # Group bindings by variable and host
     for binding in contract.bindings:
         binding_type = binding.binding_type
@@ -41,10 +43,59 @@ def generate_binding_tests(
         # Determine which hosts this binding applies to
         # For now, we'll apply to hosts from the variable contract's overlay targets
         # This is a simplification - in reality we'd need to resolve node selectors
-        hosts = _get_hosts_for_binding(spec, binding)
+        hosts = _get_hosts_for_binding(
+            spec, var_contracts.get(binding.variable)
+        )
+
+        # Type-specific fields do not depend on the host
+        fields: Dict[str, Any] = {}
+        if binding_type == "service_listen_port":
+            fields["service"] = target.get("service", "")
+            fields["protocol"] = target.get("protocol", "tcp")
+            fields["address"] = target.get("address", "0.0.0.0")
+            fields["description"] = (
+                f"Verify {target.get('service')} listens on port {expected}"
+            )
+
+        elif binding_type == "firewall_port_open":
+            fields["zone"] = target.get("zone", "public")
+            fields["protocol"] = target.get("protocol", "tcp")
+            fields["description"] = (
+                f"Verify firewall allows port {expected}/{target.get('protocol', 'tcp')}"
+            )
+
+        elif binding_type in ("template_contains", "file_contains"):
+            fields["path"] = target.get("path", "")
+            # Replace {{ value }} placeholder with actual value
+            pattern = target.get("pattern", "")
+            fields["expected_pattern"] = pattern.replace(
+                "{{ value }}", str(expected)
+            )
+            fields["description"] = (
+                f"Verify file {target.get('path')} contains expected content"
+            )
+
+        elif binding_type == "file_exists":
+            fields["path"] = target.get("path", "")
+            fields["description"] = f"Verify file {target.get('path')} exists"
+
+        elif binding_type == "file_mode":
+            fields["path"] = target.get("path", "")
+            fields["mode"] = target.get("mode", "")
+            fields["description"] = (
+                f"Verify file {target.get('path')} has correct mode"
+            )
+
+        elif binding_type == "file_owner":
+            fields["path"] = target.get("path", "")
+            fields["owner"] = target.get("owner", "")
+            fields["group"] = target.get("group", "")
+            fields["description"] = (
+                f"Verify file {target.get('path')} has correct ownership"
+            )
 
         for host in hosts:
-            test_data = {
+            tests.append({
                 "test_name": make_safe_name(
                     f"{binding.variable}_{binding_type}_{host}"
                 ),
@@ -53,60 +104,16 @@ def generate_binding_tests(
                 "variable": binding.variable,
                 "expected_value": expected,
                 "weight": binding.weight,
-            }
-
-            # Add type-specific fields
-            if binding_type == "service_listen_port":
-                test_data["service"] = target.get("service", "")
-                test_data["protocol"] = target.get("protocol", "tcp")
-                test_data["address"] = target.get("address", "0.0.0.0")
-                test_data["description"] = (
-                    f"Verify {target.get('service')} listens on port {expected}"
-                )
-
-            elif binding_type == "firewall_port_open":
-                test_data["zone"] = target.get("zone", "public")
-                test_data["protocol"] = target.get("protocol", "tcp")
-                test_data["description"] = (
-                    f"Verify firewall allows port {expected}/{target.get('protocol', 'tcp')}"
-                )
-
-            elif binding_type in ("template_contains", "file_contains"):
-                test_data["path"] = target.get("path", "")
-                # Replace {{ value }} placeholder with actual value
-                pattern = target.get("pattern", "")
-                test_data["expected_pattern"] = pattern.replace(
-                    "{{ value }}", str(expected)
-                )
-                test_data["description"] = (
-                    f"Verify file {target.get('path')} contains expected content"
-                )
-
-            elif binding_type == "file_exists":
-                test_data["path"] = target.get("path", "")
-                test_data["description"] = f"Verify file {target.get('path')} exists"
-
-            elif binding_type == "file_mode":
-                test_data["path"] = target.get("path", "")
-                test_data["mode"] = target.get("mode", "")
-                test_data["description"] = (
-                    f"Verify file {target.get('path')} has correct mode"
-                )
-
-            elif binding_type == "file_owner":
-                test_data["path"] = target.get("path", "")
-                test_data["owner"] = target.get("owner", "")
-                test_data["group"] = target.get("group", "")
-                test_data["description"] = (
-                    f"Verify file {target.get('path')} has correct ownership"
-                )
-
-            tests.append(test_data)
+                **fields,
+            })
 
     return tests
 
 
-def _get_hosts_for_binding(spec: HammerSpec, binding: BindingCheck) -> List[str]:
+def _get_hosts_for_binding(
+    spec: HammerSpec,
+    var_contract: Optional[VariableContract],
+) -> List[str]:
     """
     Determine which hosts a binding applies to.
 
@@ -116,47 +123,42 @@ def _get_hosts_for_binding(spec: HammerSpec, binding: BindingCheck) -> List[str]
     The idea is that bindings should only be tested on hosts where the
     playbook actually uses the variable, which is typically determined
     by the group scope, not by extra_vars which just override values.
-    """
-    # Return early if no variable contracts
-    if not spec.variable_contracts:
-        return []
 
-    # Find the variable contract
-    var_contract = None
-    for vc in spec.variable_contracts:
-        if vc.name == binding.variable:
-            var_contract = vc
-            break
+    Args:
+        spec: The HAMMER spec
+        var_contract: Contract of the bound variable, if one exists
 
+    Returns:
+        Sorted host names the binding should be tested on
+    """
     if not var_contract:
         return []
 
+    group_members = spec.topology.group_members
+
     # Collect hosts by specificity level
     host_vars_hosts = set()
     group_vars_hosts = set()
-    global_hosts = set()
+    global_scope = False
 
     for target in var_contract.grading_overlay_targets:
         if target.overlay_kind == "host_vars":
             # Direct host reference - most specific
             host_vars_hosts.add(target.target_name)
         elif target.overlay_kind == "group_vars":
-            # Find all hosts in this group
-            for node in spec.topology.nodes:
-                if target.target_name in node.groups:
-                    group_vars_hosts.add(node.name)
+            # All hosts in this group
+            group_vars_hosts.update(group_members.get(target.target_name, ()))
         elif target.overlay_kind in ("extra_vars", "inventory_vars"):
-            # Global scope - collect but use as fallback only
-            for node in spec.topology.nodes:
-                global_hosts.add(node.name)
+            # Global scope - use as fallback only
+            global_scope = True
 
     # Return the most specific scope that has hosts
     if host_vars_hosts:
         return sorted(host_vars_hosts)
     elif group_vars_hosts:
         return sorted(group_vars_hosts)
-    elif global_hosts:
-        return sorted(global_hosts)
+    elif global_scope:
+        return sorted(spec.topology.node_names)
     else:
         # Default to first host if nothing else found
         return [spec.topology.nodes[0].name]
@@ -1,28 +1,45 @@
 """Shared utilities for HAMMER test generation."""
 
+import functools
 import re
+import string
 from typing import Any, Dict
 
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+_SAFE_NAME_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not c.isalnum()}
+)
 
+
+@functools.lru_cache(maxsize=4096)
 def make_safe_name(s: str) -> str:
     """Convert a string to a valid Python identifier."""
-    safe = re.sub(r"[^a-zA-Z0-9]", "_", s)
-    safe = re.sub(r"^[0-9]+", "", safe)
-    safe = re.sub(r"_+", "_", safe)
-    return safe.strip("_").lower()
+    # The table only covers ASCII; anything else takes the regex path
+    if s.isascii():
+        safe = s.translate(_SAFE_NAME_TABLE)
+    else:
+        safe = _NON_ALNUM_RE.sub("_", s)
+    safe = safe.lstrip(string.digits)
+    # Collapse runs of "_" and trim them from both ends
+    return "_".join(filter(None, safe.split("_"))).lower()
 
 
 def resolve_port(port_val: Any, resolved_vars: Dict[str, Any]) -> Any:
     """Resolve a port value, handling variable references."""
-    # Check if it's a PortRefVar (has a 'var' attribute)
-    if hasattr(port_val, "var"):
-        var_name = port_val.var
-        return resolved_vars.get(var_name, port_val)
+    # Literal ports are the common case
+    if type(port_val) is int:
+        return port_val
+
+    # Firewall ports arrive dumped, so a reference is a dict with 'var'
+    if isinstance(port_val, dict):
+        if "var" in port_val:
+            return resolved_vars.get(port_val["var"], port_val)
+        return port_val
 
-    # Check if it's a dict with 'var' key
-    if isinstance(port_val, dict) and "var" in port_val:
-        var_name = port_val["var"]
+    # Otherwise it may be a PortRefVar (has a 'var' attribute)
+    var_name = getattr(port_val, "var", None)
+    if var_name is not None:
         return resolved_vars.get(var_name, port_val)
 
-    # Already an int or other value
+    # Already resolved or some other value
     return port_val
@@ -9,12 +9,18 @@ from typing import Annotated
 
 from pydantic import AfterValidator
 
+# Compiled once at import; these run for every identifier/path in a spec
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]{0,63}$')
+_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?$')
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[;&|$`\\]')
+_URL_RE = re.compile(r'^https?://[^\s;&|`]+$')
+
 
 def _check_identifier(v: str) -> str:
     """Validate that a string is a safe identifier (node names, groups, services, etc.)."""
     if not v:
         raise ValueError("Identifier must not be empty")
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]{0,63}$', v):
+    if not _IDENTIFIER_RE.match(v):
         raise ValueError(
             f"Invalid identifier: {v!r}. "
             "Must start with a letter and contain only letters, digits, underscores, or hyphens (max 64 chars)."
@@ -26,7 +32,7 @@ def _check_domain(v: str) -> str:
     """Validate that a string is a safe domain name."""
     if not v:
         raise ValueError("Domain must not be empty")
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?$', v):
+    if not _DOMAIN_RE.match(v):
         raise ValueError(f"Invalid domain: {v!r}")
     if len(v) > 253:
         raise ValueError(f"Domain too long: {len(v)} chars (max 253)")
@@ -43,7 +49,7 @@ def _check_safe_path(v: str) -> str:
         raise ValueError("Path must not be empty")
     if '..' in v.split('/'):
         raise ValueError(f"Path traversal not allowed: {v!r}")
-    if re.search(r'[;&|$`\\]', v):
+    if _UNSAFE_PATH_CHARS_RE.search(v):
         raise ValueError(f"Unsafe characters in path: {v!r}")
     return v
 
@@ -56,7 +62,7 @@ def _check_relative_path(v: str) -> str:
         raise ValueError(f"Path traversal not allowed: {v!r}")
     if v.startswith('/'):
         raise ValueError(f"Expected relative path, got absolute: {v!r}")
-    if re.search(r'[;&|$`\\]', v):
+    if _UNSAFE_PATH_CHARS_RE.search(v):
         raise ValueError(f"Unsafe characters in path: {v!r}")
     return v
 
@@ -76,7 +82,7 @@ def _check_safe_url(v: str) -> str:
     if not v:
         raise ValueError("URL must not be empty")
     # Allow http/https URLs and template variable references
-    if not re.match(r'^https?://[^\s;&|`]+$', v):
+    if not _URL_RE.match(v):
         raise ValueError(f"Invalid URL: {v!r}")
     return v
 
@@ -85,7 +91,7 @@ def _check_safe_zone(v: str) -> str:
     """Validate firewall zone name."""
     if not v:
         raise ValueError("Zone must not be empty")
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]{0,63}$', v):
+    if not _IDENTIFIER_RE.match(v):
         raise ValueError(f"Invalid zone name: {v!r}")
     return v
 
@@ -1,11 +1,12 @@
 """Unit tests for the reboot module."""
 
+import asyncio
 import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-import subprocess
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
+import yaml
 
 # Ensure src is in path
 PROJECT_ROOT = Path(__file__).parents[2]
@@ -16,38 +17,52 @@ from hammer.runner.reboot import (
     _reboot_single_node,
     _check_ssh_available,
     _get_all_nodes_from_inventory,
+    _wait_for_exit,
+    _check_ssh_available_batch,
+    _SshWatcher,
+    _ansible_env,
+    _check_ssh_banner,
+    _get_ssh_addresses,
     RebootResult,
+    ANSIBLE_RC_UNREACHABLE,
+    BANNER_MISSES_BEFORE_PING,
 )
 
 
 class TestCheckSshAvailable:
     """Tests for _check_ssh_available function."""
 
-    @patch("hammer.runner.reboot.subprocess.run")
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
     def test_ssh_available_returns_true(self, mock_run):
         """Test that successful ping returns True."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = 0
 
-        result = _check_ssh_available(Path("/fake/inventory.yml"), "node1")
+        result = asyncio.run(
+            _check_ssh_available("/fake/inventory.yml", "node1")
+        )
 
         assert result is True
         mock_run.assert_called_once()
 
-    @patch("hammer.runner.reboot.subprocess.run")
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
     def test_ssh_unavailable_returns_false(self, mock_run):
         """Test that failed ping returns False."""
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_run.return_value = 1
 
-        result = _check_ssh_available(Path("/fake/inventory.yml"), "node1")
+        result = asyncio.run(
+            _check_ssh_available("/fake/inventory.yml", "node1")
+        )
 
         assert result is False
 
-    @patch("hammer.runner.reboot.subprocess.run")
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
     def test_ssh_timeout_returns_false(self, mock_run):
         """Test that timeout returns False."""
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="ansible", timeout=10)
+        mock_run.return_value = None
 
-        result = _check_ssh_available(Path("/fake/inventory.yml"), "node1")
+        result = asyncio.run(
+            _check_ssh_available("/fake/inventory.yml", "node1")
+        )
 
         assert result is False
 
@@ -93,7 +108,27 @@ all:
 
         nodes = _get_all_nodes_from_inventory(inventory_file)
 
-        assert set(nodes) == {"web1", "web2", "db1"}
+        assert nodes == ["db1", "web1", "web2"]
+
+    def test_host_in_several_groups_listed_once(self, tmp_path):
+        """Test that a host in multiple groups appears once."""
+        inventory_content = """
+all:
+  children:
+    webservers:
+      hosts:
+        node1: {}
+    monitored:
+      hosts:
+        node1: {}
+        node2: {}
+"""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text(inventory_content)
+
+        nodes = _get_all_nodes_from_inventory(inventory_file)
+
+        assert nodes == ["node1", "node2"]
 
     def test_invalid_inventory_returns_empty(self, tmp_path):
         """Test that invalid inventory returns empty list."""
@@ -104,6 +139,92 @@ all:
 
         assert nodes == []
 
+    def test_inventory_parse_is_cached(self, tmp_path):
+        """Test that an unchanged inventory is only parsed once."""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text("all:\n  hosts:\n    node1: {}\n")
+
+        with patch("hammer.runner.reboot.yaml.load", wraps=yaml.load) as mock_load:
+            _get_all_nodes_from_inventory(inventory_file)
+            _get_all_nodes_from_inventory(inventory_file)
+
+        assert mock_load.call_count == 1
+
+    def test_changed_inventory_is_reparsed(self, tmp_path):
+        """Test that editing the inventory invalidates the cache."""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text("all:\n  hosts:\n    node1: {}\n")
+        assert _get_all_nodes_from_inventory(inventory_file) == ["node1"]
+
+        inventory_file.write_text("all:\n  hosts:\n    node1: {}\n    node22: {}\n")
+
+        assert set(_get_all_nodes_from_inventory(inventory_file)) == {"node1", "node22"}
+
+    def test_ssh_addresses_from_host_vars(self, tmp_path):
+        """Test that ansible_host/ansible_port are read per node."""
+        inventory_content = """
+all:
+  children:
+    servers:
+      hosts:
+        node1:
+          ansible_host: 192.168.1.1
+        node2:
+          ansible_host: 192.168.1.2
+          ansible_port: 2222
+        node3:
+"""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text(inventory_content)
+
+        addresses = _get_ssh_addresses(inventory_file)
+
+        assert addresses == {
+            "node1": ("192.168.1.1", 22),
+            "node2": ("192.168.1.2", 2222),
+        }
+
+    def test_invalid_ansible_port_keeps_other_hosts(self, tmp_path):
+        """Test that a non-integer port drops only that host's address."""
+        inventory_content = """
+all:
+  hosts:
+    node1:
+      ansible_host: 192.168.1.1
+      ansible_port: "{{ ssh_port }}"
+    node2:
+      ansible_host: "{{ lookup('env', 'NODE2') }}"
+    node3:
+      ansible_host: 192.168.1.3
+"""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text(inventory_content)
+
+        assert _get_all_nodes_from_inventory(inventory_file) == [
+            "node1", "node2", "node3"
+        ]
+        assert _get_ssh_addresses(inventory_file) == {"node3": ("192.168.1.3", 22)}
+
+    def test_ssh_address_kept_across_group_entries(self, tmp_path):
+        """Test that a bare entry in another group keeps the host's address."""
+        inventory_content = """
+all:
+  children:
+    web:
+      hosts:
+        node1:
+          ansible_host: 192.168.1.1
+    app:
+      hosts:
+        node1:
+        node2:
+"""
+        inventory_file = tmp_path / "hosts.yml"
+        inventory_file.write_text(inventory_content)
+
+        assert _get_ssh_addresses(inventory_file) == {"node1": ("192.168.1.1", 22)}
+        assert _get_all_nodes_from_inventory(inventory_file) == ["node1", "node2"]
+
     def test_nonexistent_inventory_returns_empty(self):
         """Test that nonexistent file returns empty list."""
         nodes = _get_all_nodes_from_inventory(Path("/nonexistent/path.yml"))
@@ -111,57 +232,344 @@ all:
         assert nodes == []
 
 
+class TestWaitForExit:
+    """Tests for _wait_for_exit function."""
+
+    def test_process_exits_in_time(self):
+        """Test that a process exiting before the timeout returns True."""
+        async def run():
+            proc = await asyncio.create_subprocess_exec(sys.executable, "-c", "")
+            return await _wait_for_exit(proc, 10)
+
+        assert asyncio.run(run()) is True
+
+    def test_process_killed_on_timeout(self):
+        """Test that a process outliving the timeout is killed."""
+        async def run():
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-c", "import time; time.sleep(30)"
+            )
+            exited = await _wait_for_exit(proc, 0.1)
+            return exited, proc.returncode
+
+        exited, returncode = asyncio.run(run())
+
+        assert exited is False
+        assert returncode is not None
+
+
 class TestRebootSingleNode:
     """Tests for _reboot_single_node function."""
 
-    @patch("hammer.runner.reboot._check_ssh_available")
-    @patch("hammer.runner.reboot.subprocess.run")
-    @patch("hammer.runner.reboot.time.sleep")
-    def test_successful_reboot(self, mock_sleep, mock_run, mock_ssh):
-        """Test successful node reboot."""
-        mock_run.return_value = MagicMock()
-        # First call returns False (rebooting), second call returns True (back up)
-        mock_ssh.side_effect = [False, True]
+    @patch("hammer.runner.reboot._wait_for_exit", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._start_ssh_sentinel", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
+    def test_sentinel_exit_detects_ssh_down(
+        self, mock_run, mock_batch, mock_ssh, mock_sentinel, mock_wait
+    ):
+        """Test that the sentinel exiting replaces the SSH-down ping loop."""
+        mock_run.return_value = 0
+        mock_sentinel.return_value = MagicMock(returncode=ANSIBLE_RC_UNREACHABLE)
+        mock_wait.return_value = True
+        mock_batch.return_value = {"node1": True}
+
+        result = asyncio.run(_reboot_single_node(
+            "/fake/inventory.yml",
+            "node1",
+            timeout=120,
+            poll_interval=5,
+        ))
 
-        result = _reboot_single_node(
-            Path("/fake/inventory.yml"),
+        assert result.success is True
+        mock_wait.assert_awaited_once()
+        mock_ssh.assert_not_awaited()
+        mock_batch.assert_awaited_once()
+
+    @patch("hammer.runner.reboot._start_ssh_sentinel", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot.asyncio.sleep", new_callable=AsyncMock)
+    def test_sentinel_failing_early_falls_back_to_ping(
+        self, mock_sleep, mock_run, mock_batch, mock_ssh, mock_sentinel
+    ):
+        """Test that a sentinel exiting with rc 2 does not count as SSH down."""
+        async def failing_sentinel(*args, **kwargs):
+            return await asyncio.create_subprocess_exec(
+                sys.executable, "-c", "raise SystemExit(2)"
+            )
+
+        mock_run.return_value = 0
+        mock_sentinel.side_effect = failing_sentinel
+        # SSH never drops, so the reboot never happened
+        mock_ssh.return_value = True
+        mock_batch.return_value = {"node1": True}
+
+        result = asyncio.run(_reboot_single_node(
+            "/fake/inventory.yml",
             "node1",
             timeout=120,
             poll_interval=5,
-        )
+        ))
+
+        assert result.success is False
+        assert "SSH never went down" in result.error
+        assert mock_ssh.await_count > 0
+        mock_batch.assert_not_awaited()
+
+    @patch("hammer.runner.reboot._wait_for_exit", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._start_ssh_sentinel", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
+    def test_sentinel_never_exits(self, mock_run, mock_sentinel, mock_wait):
+        """Test that a surviving sentinel means the reboot did not start."""
+        mock_run.return_value = 0
+        mock_sentinel.return_value = MagicMock()
+        mock_wait.return_value = False
+
+        result = asyncio.run(_reboot_single_node(
+            "/fake/inventory.yml",
+            "node1",
+            timeout=120,
+            poll_interval=5,
+        ))
+
+        assert result.success is False
+        assert "SSH never went down" in result.error
+
+    @patch("hammer.runner.reboot._start_ssh_sentinel", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot.asyncio.sleep", new_callable=AsyncMock)
+    def test_successful_reboot(
+        self, mock_sleep, mock_run, mock_batch, mock_ssh, mock_sentinel
+    ):
+        """Test successful node reboot."""
+        mock_run.return_value = 0
+        mock_sentinel.return_value = None  # Fall back to the ping loop
+        # Ping fails once (rebooting), then the batched check sees it back up
+        mock_ssh.return_value = False
+        mock_batch.return_value = {"node1": True}
+
+        result = asyncio.run(_reboot_single_node(
+            "/fake/inventory.yml",
+            "node1",
+            timeout=120,
+            poll_interval=5,
+        ))
 
         assert result.success is True
         assert result.error is None
 
-    @patch("hammer.runner.reboot._check_ssh_available")
-    @patch("hammer.runner.reboot.subprocess.run")
-    @patch("hammer.runner.reboot.time.sleep")
-    @patch("hammer.runner.reboot.time.time")
-    def test_reboot_timeout(self, mock_time, mock_sleep, mock_run, mock_ssh):
+    @patch("hammer.runner.reboot._wait_for_exit", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._start_ssh_sentinel", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._run_ansible", new_callable=AsyncMock)
+    def test_reboot_timeout(self, mock_run, mock_batch, mock_sentinel, mock_wait):
         """Test node reboot timeout."""
-        mock_run.return_value = MagicMock()
-        mock_ssh.return_value = False  # Never comes back
+        mock_run.return_value = 0
+        mock_sentinel.return_value = MagicMock(returncode=ANSIBLE_RC_UNREACHABLE)
+        mock_wait.return_value = True
+        mock_batch.return_value = {"node1": False}  # Never comes back
 
-        # Simulate time passing: 0, 5, 10, ..., 125 (past timeout)
-        mock_time.side_effect = [0, 0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50,
-                                  55, 60, 65, 70, 75, 80, 85, 90, 95, 100,
-                                  105, 110, 115, 120, 125]
-
-        result = _reboot_single_node(
-            Path("/fake/inventory.yml"),
+        result = asyncio.run(_reboot_single_node(
+            "/fake/inventory.yml",
             "node1",
-            timeout=120,
-            poll_interval=5,
-        )
+            timeout=0.2,
+            poll_interval=0.01,
+        ))
 
         assert result.success is False
         assert "SSH did not become available" in result.error
 
 
+class TestSshWatcher:
+    """Tests for the batched _SshWatcher."""
+
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    def test_waiting_nodes_share_one_ping_per_tick(self, mock_batch):
+        """Test that concurrent waiters are checked by one batched ping."""
+        mock_batch.side_effect = [
+            {"node1": False, "node2": False},
+            {"node1": True, "node2": True},
+        ]
+
+        async def run():
+            watcher = _SshWatcher("/fake/inventory.yml", 0.01)
+            await asyncio.gather(
+                watcher.wait_until_up("node1"),
+                watcher.wait_until_up("node2"),
+            )
+
+        asyncio.run(run())
+
+        assert mock_batch.await_count == 2
+        assert sorted(mock_batch.await_args.args[1]) == ["node1", "node2"]
+
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    def test_nodes_stop_being_checked_once_up(self, mock_batch):
+        """Test that a node that came back is dropped from later batches."""
+        mock_batch.side_effect = [
+            {"node1": True, "node2": False},
+            {"node2": True},
+        ]
+
+        async def run():
+            watcher = _SshWatcher("/fake/inventory.yml", 0.01)
+            await asyncio.gather(
+                watcher.wait_until_up("node1"),
+                watcher.wait_until_up("node2"),
+            )
+
+        asyncio.run(run())
+
+        assert mock_batch.await_args.args[1] == ["node2"]
+
+    @patch("hammer.runner.reboot.asyncio.sleep", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    def test_poll_delay_backs_off_to_poll_interval(self, mock_batch, mock_sleep):
+        """Test that ticks start at one second and back off to poll_interval."""
+        mock_batch.side_effect = [{"node1": False}] * 5 + [{"node1": True}]
+
+        async def run():
+            watcher = _SshWatcher("/fake/inventory.yml", 3)
+            await watcher.wait_until_up("node1")
+
+        asyncio.run(run())
+
+        delays = [c.args[0] for c in mock_sleep.await_args_list]
+        assert delays == [1.0, 1.5, 2.25, 3, 3]
+
+    @patch("hammer.runner.reboot._get_ssh_addresses")
+    @patch("hammer.runner.reboot._check_ssh_banner", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    def test_ping_skipped_until_sshd_answers(
+        self, mock_batch, mock_banner, mock_addresses
+    ):
+        """Test that ansible is only spawned once the SSH port answers."""
+        mock_addresses.return_value = {"node1": ("192.168.1.1", 22)}
+        mock_banner.side_effect = [False, False, True]
+        mock_batch.return_value = {"node1": True}
+
+        async def run():
+            watcher = _SshWatcher("/fake/inventory.yml", 0.01)
+            await watcher.wait_until_up("node1")
+
+        asyncio.run(run())
+
+        assert mock_banner.await_count == 3
+        mock_batch.assert_awaited_once()
+
+    @patch("hammer.runner.reboot._get_ssh_addresses")
+    @patch("hammer.runner.reboot._check_ssh_banner", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._check_ssh_available_batch", new_callable=AsyncMock)
+    def test_silent_port_still_pinged_periodically(
+        self, mock_batch, mock_banner, mock_addresses
+    ):
+        """Test that a node with a wrong inventory address is still pinged."""
+        mock_addresses.return_value = {"node1": ("node1", 22)}
+        mock_banner.return_value = False
+        mock_batch.return_value = {"node1": True}
+
+        async def run():
+            watcher = _SshWatcher("/fake/inventory.yml", 0.01)
+            await watcher.wait_until_up("node1")
+
+        asyncio.run(run())
+
+        assert mock_banner.await_count == BANNER_MISSES_BEFORE_PING
+        mock_batch.assert_awaited_once()
+
+
+class TestCheckSshBanner:
+    """Tests for _check_ssh_banner function."""
+
+    def _serve(self, payload: bytes):
+        async def handle(reader, writer):
+            writer.write(payload)
+            await writer.drain()
+            writer.close()
+
+        return asyncio.start_server(handle, "127.0.0.1", 0)
+
+    def test_ssh_banner_detected(self):
+        """Test that a server sending an SSH banner counts as up."""
+        async def run():
+            server = await self._serve(b"SSH-2.0-OpenSSH_8.7\r\n")
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await _check_ssh_banner("127.0.0.1", port)
+
+        assert asyncio.run(run()) is True
+
+    def test_non_ssh_server_not_up(self):
+        """Test that a non-SSH service on the port does not count as up."""
+        async def run():
+            server = await self._serve(b"HTTP/1.1 400 Bad Request\r\n")
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await _check_ssh_banner("127.0.0.1", port)
+
+        assert asyncio.run(run()) is False
+
+    def test_connection_refused_not_up(self):
+        """Test that a closed port counts as down."""
+        async def run():
+            server = await self._serve(b"")
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            return await _check_ssh_banner("127.0.0.1", port, timeout=1)
+
+        assert asyncio.run(run()) is False
+
+
+class TestCheckSshAvailableBatch:
+    """Tests for _check_ssh_available_batch function."""
+
+    @patch(
+        "hammer.runner.reboot.asyncio.create_subprocess_exec",
+        new_callable=AsyncMock,
+    )
+    def test_parses_one_line_output(self, mock_exec):
+        """Test that per-host results are parsed from --one-line output."""
+        proc = MagicMock()
+        proc.communicate = AsyncMock(return_value=(
+            b'node1 | SUCCESS => {"changed": false, "ping": "pong"}\n'
+            b'node2 | UNREACHABLE! => {"changed": false, "unreachable": true}\n',
+            b"",
+        ))
+        mock_exec.return_value = proc
+
+        status = asyncio.run(_check_ssh_available_batch(
+            "/fake/inventory.yml", ["node1", "node2", "node3"]
+        ))
+
+        assert status == {"node1": True, "node2": False, "node3": False}
+        args = mock_exec.await_args.args
+        assert args[:2] == ("ansible", "node1,node2,node3")
+
+    @patch(
+        "hammer.runner.reboot.asyncio.create_subprocess_exec",
+        new_callable=AsyncMock,
+    )
+    def test_missing_ansible_reports_all_down(self, mock_exec):
+        """Test that a failure to start ansible marks every node down."""
+        mock_exec.side_effect = FileNotFoundError("ansible")
+
+        status = asyncio.run(_check_ssh_available_batch(
+            "/fake/inventory.yml", ["node1"]
+        ))
+
+        assert status == {"node1": False}
+
+
 class TestRebootNodes:
     """Tests for reboot_nodes function."""
 
-    @patch("hammer.runner.reboot._reboot_single_node")
+    @patch("hammer.runner.reboot._reboot_single_node", new_callable=AsyncMock)
     @patch("hammer.runner.reboot._get_all_nodes_from_inventory")
     def test_reboot_specific_nodes(self, mock_get_nodes, mock_reboot):
         """Test rebooting specific nodes."""
@@ -180,7 +588,7 @@ class TestRebootNodes:
         assert results["node1"].success is True
         mock_get_nodes.assert_not_called()
 
-    @patch("hammer.runner.reboot._reboot_single_node")
+    @patch("hammer.runner.reboot._reboot_single_node", new_callable=AsyncMock)
     @patch("hammer.runner.reboot._get_all_nodes_from_inventory")
     def test_reboot_all_nodes(self, mock_get_nodes, mock_reboot):
         """Test rebooting all nodes when nodes=None."""
@@ -197,6 +605,60 @@ class TestRebootNodes:
         assert len(results) == 3
         mock_get_nodes.assert_called_once()
 
+    @patch("hammer.runner.reboot._reboot_single_node", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._get_all_nodes_from_inventory")
+    def test_reboot_nodes_run_concurrently(self, mock_get_nodes, mock_reboot):
+        """Test that all node reboots are in flight at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_reboot(inventory_path, node, timeout, poll_interval, watcher):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return RebootResult(success=True, duration=1.0)
+
+        mock_reboot.side_effect = fake_reboot
+
+        results = reboot_nodes(
+            Path("/fake/inventory.yml"),
+            nodes=["node1", "node2", "node3"],
+        )
+
+        assert list(results) == ["node1", "node2", "node3"]
+        assert peak == 3
+
+    @patch("hammer.runner.reboot._reboot_single_node", new_callable=AsyncMock)
+    @patch("hammer.runner.reboot._get_all_nodes_from_inventory")
+    def test_reboot_exception_isolated_to_node(self, mock_get_nodes, mock_reboot):
+        """Test that one node raising does not fail the other reboots."""
+        mock_reboot.side_effect = [
+            RebootResult(success=True, duration=30.0),
+            RuntimeError("boom"),
+        ]
+
+        results = reboot_nodes(
+            Path("/fake/inventory.yml"),
+            nodes=["node1", "node2"],
+        )
+
+        assert results["node1"].success is True
+        assert results["node2"].success is False
+        assert "boom" in results["node2"].error
+
+    @patch("hammer.runner.reboot._reboot_single_node", new_callable=AsyncMock)
+    def test_inventory_converted_to_str_once(self, mock_reboot):
+        """Test that every node reboot shares one inventory string."""
+        mock_reboot.return_value = RebootResult(success=True, duration=1.0)
+
+        reboot_nodes(Path("/fake/inventory.yml"), nodes=["node1", "node2"])
+
+        inventories = [c.args[0] for c in mock_reboot.call_args_list]
+        assert inventories == ["/fake/inventory.yml"] * 2
+        assert inventories[0] is inventories[1]
+
 
 class TestRebootResult:
     """Tests for RebootResult dataclass."""
@@ -220,3 +682,64 @@ class TestRebootResult:
         assert result.success is False
         assert result.duration == 120.0
         assert result.error == "SSH timeout"
+
+
+class TestAnsibleEnv:
+    """Tests for the ansible subprocess environment."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_ansible_config(self, tmp_path, monkeypatch):
+        """Run each test without the caller's ansible settings."""
+        for name in ("ANSIBLE_SSH_ARGS", "ANSIBLE_PIPELINING", "ANSIBLE_TIMEOUT"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("ANSIBLE_CONFIG", str(tmp_path / "ansible.cfg"))
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+
+    def test_enables_connection_reuse(self):
+        """Test that SSH multiplexing and pipelining are enabled."""
+        env = _ansible_env()
+
+        assert "ControlMaster=auto" in env["ANSIBLE_SSH_ARGS"]
+        assert "StrictHostKeyChecking" not in env["ANSIBLE_SSH_ARGS"]
+        assert env["ANSIBLE_PIPELINING"] == "True"
+        assert env["ANSIBLE_HOST_KEY_CHECKING"] == "False"
+
+    def test_operator_environment_kept(self, monkeypatch):
+        """Test that variables already in the environment are not replaced."""
+        monkeypatch.setenv("ANSIBLE_SSH_ARGS", "-o ProxyJump=bastion")
+
+        env = _ansible_env()
+
+        assert env["ANSIBLE_SSH_ARGS"] == "-o ProxyJump=bastion"
+        assert env["ANSIBLE_PIPELINING"] == "True"
+
+    def test_operator_config_kept(self, tmp_path):
+        """Test that options set in ansible.cfg are not overridden."""
+        (tmp_path / "ansible.cfg").write_text(
+            "[ssh_connection]\n"
+            "ssh_args = -o IdentityFile=~/.ssh/lab\n"
+            "[defaults]\n"
+            "pipelining = False\n"
+        )
+
+        env = _ansible_env()
+
+        assert "ANSIBLE_SSH_ARGS" not in env
+        assert "ANSIBLE_PIPELINING" not in env
+        assert env["ANSIBLE_TIMEOUT"] == "5"
+
+    @patch(
+        "hammer.runner.reboot.asyncio.create_subprocess_exec",
+        new_callable=AsyncMock,
+    )
+    def test_batch_check_uses_ansible_env(self, mock_exec):
+        """Test that ansible subprocesses receive the tuned environment."""
+        proc = MagicMock()
+        proc.communicate = AsyncMock(return_value=(b"", b""))
+        mock_exec.return_value = proc
+
+        asyncio.run(_check_ssh_available_batch("/fake/inventory.yml", ["node1"]))
+
+        env = mock_exec.await_args.kwargs["env"]
+        assert "ControlPersist=60s" in env["ANSIBLE_SSH_ARGS"]
@@ -20,10 +20,15 @@ from hammer.runner.results import (
     GradeReport,
     calculate_phase_score,
     calculate_total_score,
+    dump_result_json,
     write_handler_runs,
 )
 from hammer.runner.ansible import check_idempotence, parse_handler_runs
-from hammer.runner.snapshot import get_files_to_check, render_snapshot_playbook
+from hammer.runner.snapshot import (
+    get_files_to_check,
+    render_snapshot_playbook,
+    write_snapshot_playbook,
+)
 
 FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures"
 
@@ -65,6 +70,21 @@ class TestConvergeResult:
         assert result.failed == 1
         assert result.success is False
 
+    def test_converge_result_is_slotted(self):
+        """ConvergeResult should not carry a per-instance __dict__."""
+        result = ConvergeResult()
+        assert not hasattr(result, "__dict__")
+
+    def test_dump_result_json(self):
+        """Result dataclasses should serialize to indented JSON."""
+        import json
+
+        result = ConvergeResult(ok=2, handlers_run={"restart nginx": 1})
+        data = json.loads(dump_result_json(result))
+        assert data["ok"] == 2
+        assert data["handlers_run"] == {"restart nginx": 1}
+        assert data["error_message"] is None
+
 
 class TestIdempotenceCheck:
     """Tests for idempotence checking."""
@@ -172,6 +192,10 @@ class TestScoreCalculation:
         assert max_score == 20.0
         assert pct == 75.0
 
+    def test_total_score_no_phases(self):
+        """No phases should yield zero scores."""
+        assert calculate_total_score({}) == (0.0, 0.0, 0.0)
+
 
 class TestGradeReport:
     """Tests for GradeReport model."""
@@ -193,12 +217,40 @@ class TestGradeReport:
             spec_version="1.0",
             total_score=15.0,
             max_score=20.0,
-            percentage=75.0,
         )
         json_str = report.model_dump_json()
         assert "test-assignment" in json_str
         assert "75.0" in json_str
 
+    def test_grade_report_percentage_follows_scores(self):
+        """GradeReport percentage should be derived from the current scores."""
+        report = GradeReport(assignment_id="test-assignment", spec_version="1.0")
+        assert report.percentage == 0.0
+
+        report.total_score = 3.0
+        report.max_score = 4.0
+        assert report.percentage == 75.0
+        assert report.model_dump()["percentage"] == 75.0
+
+    def test_grade_report_serializes_phase_dataclasses(self):
+        """Phase results nested in GradeReport should serialize to JSON."""
+        import json
+
+        report = GradeReport(assignment_id="test-assignment", spec_version="1.0")
+        report.phases["baseline"] = PhaseResult(
+            phase="baseline",
+            converge=ConvergeResult(ok=3),
+            tests=TestResult(
+                passed=1,
+                details=[TestCaseResult(name="test_x", outcome="passed")],
+            ),
+            score=1.0,
+            max_score=1.0,
+        )
+        data = json.loads(report.model_dump_json())
+        assert data["phases"]["baseline"]["converge"]["ok"] == 3
+        assert data["phases"]["baseline"]["tests"]["details"][0]["name"] == "test_x"
+
 
 class TestSnapshotPlaybook:
     """Tests for snapshot playbook generation."""
@@ -210,6 +262,11 @@ class TestSnapshotPlaybook:
         # Should include nginx config file from spec
         assert any("nginx" in f for f in files)
 
+    def test_get_files_to_check_sorted_unique(self, full_spec, plan):
+        """Should return each path once, in sorted order."""
+        files = get_files_to_check(full_spec, plan)
+        assert files == sorted(set(files))
+
     def test_render_snapshot_playbook(self, full_spec, plan):
         """Should render valid YAML playbook."""
         import yaml
@@ -230,6 +287,44 @@ class TestSnapshotPlaybook:
             assert "tasks" in play
             assert len(play["tasks"]) > 0
 
+    def test_snapshot_template_compiled_once(self, full_spec, plan):
+        """Repeated renders should reuse the same compiled template."""
+        from hammer.runner.snapshot import _get_snapshot_template
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot_dir = Path(tmpdir) / "snapshots"
+            first = render_snapshot_playbook(full_spec, plan, "baseline", snapshot_dir)
+            template = _get_snapshot_template()
+            second = render_snapshot_playbook(full_spec, plan, "baseline", snapshot_dir)
+
+        assert first == second
+        assert _get_snapshot_template() is template
+
+    def test_write_snapshot_playbook_skips_identical_content(self, full_spec, plan):
+        """Rewriting an unchanged playbook should not touch the file."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            playbook = write_snapshot_playbook(full_spec, plan, "baseline", output_dir)
+            os.utime(playbook, ns=(0, 0))
+
+            again = write_snapshot_playbook(full_spec, plan, "baseline", output_dir)
+
+            assert again == playbook
+            assert playbook.stat().st_mtime_ns == 0
+
+    def test_write_snapshot_playbook_rewrites_changed_content(self, full_spec, plan):
+        """A stale playbook should be replaced with the rendered content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            (output_dir / "snapshot_baseline.yml").write_text("stale")
+
+            playbook = write_snapshot_playbook(full_spec, plan, "baseline", output_dir)
+
+            assert playbook.read_text() != "stale"
+            assert "baseline" in playbook.read_text()
+
 
 class TestHandlerRunsParsing:
     """Tests for handler runs parsing from Ansible output."""
@@ -339,3 +434,20 @@ class TestWriteHandlerRuns:
             assert handler_file.exists()
             data = json.loads(handler_file.read_text())
             assert data == {}
+
+    def test_write_handler_runs_replaces_previous_file(self):
+        """Should atomically replace an earlier file and leave no temp file."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            grading_dir = Path(tmpdir)
+            write_handler_runs(
+                grading_dir, "baseline", ConvergeResult(handlers_run={"a": 1})
+            )
+
+            handler_file = write_handler_runs(
+                grading_dir, "baseline", ConvergeResult(handlers_run={"b": 2})
+            )
+
+            assert json.loads(handler_file.read_text()) == {"b": 2}
+            assert [p.name for p in handler_file.parent.iterdir()] == ["baseline.json"]
@@ -70,6 +70,40 @@ def test_topology_duplicate_nodes():
     assert "Duplicate node names in topology" in str(exc_info.value)
 
 
+def test_topology_name_index():
+    """Test that topology exposes node and group names, excluded from dumps."""
+    spec = load_spec_from_file(FIXTURES_DIR / "valid_full.yaml")
+    topology = spec.topology
+
+    assert topology.node_names == {n.name for n in topology.nodes}
+    assert topology.group_names == {g for n in topology.nodes for g in n.groups}
+    assert topology.node_names is topology.node_names
+    for group, members in topology.group_members.items():
+        assert list(members) == [n.name for n in topology.nodes if group in n.groups]
+    assert "node_names" not in topology.model_dump()
+
+
+def test_topology_copy_recomputes_name_index():
+    """Test that model_copy does not carry cached names over to the copy."""
+    spec = load_spec_from_file(FIXTURES_DIR / "valid_full.yaml")
+    topology = spec.topology
+    assert "web" in topology.group_members  # populate the caches
+
+    renamed = [
+        n.model_copy(update={"name": f"{n.name}x", "groups": ["renamed"]})
+        for n in topology.nodes
+    ]
+    copied = topology.model_copy(update={"nodes": renamed})
+
+    assert copied.node_names == {n.name for n in renamed}
+    assert set(copied.group_members) == {"renamed"}
+    assert copied.group_names == {"renamed"}
+    assert "web" in topology.group_members
+    assert copied.model_dump() == topology.model_dump() | {
+        "nodes": [n.model_dump() for n in renamed]
+    }
+
+
 # -------------------------
 # PE4 Support Tests
 # -------------------------
@@ -356,3 +390,142 @@ def test_failure_policy_default():
 
     spec = HammerSpec.model_validate(data)
     assert spec.phase_overlays.baseline.failure_policy is None
+
+
+def test_load_spec_matches_safe_load():
+    """Test that the fast YAML loader yields the same spec as yaml.safe_load."""
+    import yaml
+
+    spec_path = FIXTURES_DIR / "valid_full.yaml"
+    with open(spec_path, "r") as f:
+        expected = HammerSpec.model_validate(yaml.safe_load(f))
+
+    assert load_spec_from_file(spec_path) == expected
+
+
+def test_trusted_load_skips_semantic_validation(tmp_path):
+    """Test that a trusted load skips cross-field checks but not field checks."""
+    import yaml
+
+    with open(FIXTURES_DIR / "valid_full.yaml", "r") as f:
+        data = yaml.safe_load(f)
+    data["features"]["handlers"] = False
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(yaml.safe_dump(data))
+
+    with pytest.raises(ValidationError):
+        load_spec_from_file(spec_path)
+
+    spec = load_spec_from_file(spec_path, trusted=True)
+    assert spec.features.handlers is False
+
+    data["assignment_id"] = "bad id!"
+    spec_path.write_text(yaml.safe_dump(data))
+    with pytest.raises(ValidationError):
+        load_spec_from_file(spec_path, trusted=True)
+
+
+def test_loaded_spec_is_frozen():
+    """Test that cached specs cannot be mutated by one of their holders."""
+    spec = load_spec_from_file(FIXTURES_DIR / "valid_full.yaml")
+
+    with pytest.raises(ValidationError):
+        spec.seed = 1
+    with pytest.raises(ValidationError):
+        spec.topology.nodes[0].name = "other"
+
+
+def test_from_trusted_round_trip():
+    """Test that a dumped spec can be rebuilt without the semantic pass."""
+    spec = load_spec_from_file(FIXTURES_DIR / "valid_full.yaml")
+
+    assert HammerSpec.from_trusted(spec.model_dump()) == spec
+
+    data = spec.model_dump()
+    data["features"]["handlers"] = False
+    assert HammerSpec.from_trusted(data).features.handlers is False
+
+
+def test_validate_semantics_on_trusted_spec(tmp_path):
+    """Test that semantic checks can be run explicitly on a trusted spec."""
+    import yaml
+
+    from hammer.spec import validate_semantics
+
+    with open(FIXTURES_DIR / "valid_full.yaml", "r") as f:
+        data = yaml.safe_load(f)
+    data["features"]["handlers"] = False
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(yaml.safe_dump(data))
+
+    spec = load_spec_from_file(spec_path, trusted=True)
+    with pytest.raises(ValueError, match="features.handlers is false"):
+        validate_semantics(spec)
+
+    validate_semantics(load_spec_from_file(FIXTURES_DIR / "valid_full.yaml"))
+
+
+def test_spec_json_schema_cached():
+    """Test that the HammerSpec JSON schema is generated once and reused."""
+    from hammer.spec import spec_json_schema
+
+    schema = spec_json_schema()
+    assert schema == HammerSpec.model_json_schema()
+    assert spec_json_schema() is schema
+
+
+@pytest.mark.parametrize(
+    "spec_path",
+    sorted(FIXTURES_DIR.glob("*.yaml"))
+    + sorted((PROJECT_ROOT / "real_examples").glob("*/spec.yaml")),
+    ids=lambda p: f"{p.parent.name}/{p.name}",
+)
+def test_specs_match_published_json_schema(spec_path):
+    """Test that shipped specs validate against the `hammer schema` output."""
+    jsonschema = pytest.importorskip("jsonschema")
+    import yaml
+
+    from hammer.spec import spec_json_schema
+
+    with open(spec_path, "r") as f:
+        data = yaml.safe_load(f)
+
+    jsonschema.validate(data, spec_json_schema())
+
+
+def test_load_spec_cached_until_file_changes(tmp_path):
+    """Test that reloading an unchanged spec reuses the parsed model."""
+    import os
+
+    import yaml
+
+    with open(FIXTURES_DIR / "valid_full.yaml", "r") as f:
+        data = yaml.safe_load(f)
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(yaml.safe_dump(data))
+
+    first = load_spec_from_file(spec_path)
+    assert load_spec_from_file(spec_path) is first
+
+    data["seed"] = 4242
+    spec_path.write_text(yaml.safe_dump(data))
+    st = os.stat(spec_path)
+    os.utime(spec_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    reloaded = load_spec_from_file(spec_path)
+    assert reloaded is not first
+    assert reloaded.seed == 4242
+
+
+def test_importing_spec_models_does_not_import_yaml():
+    """Test that PyYAML is only imported when a spec file is loaded."""
+    import subprocess
+
+    code = "import sys, hammer.spec; print('yaml' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"PYTHONPATH": str(PROJECT_ROOT / "src")},
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -96,6 +96,32 @@ class TestInvalidBindingTargets:
 
         assert "nonexistent_host" in str(exc_info.value)
 
+    def test_first_unknown_overlay_target_reported(self):
+        """An unknown host listed before an unknown group is reported first."""
+        data = load_base_spec()
+
+        data["variable_contracts"][0]["grading_overlay_targets"] = [
+            {"overlay_kind": "host_vars", "target_name": "ghost_host"},
+            {"overlay_kind": "group_vars", "target_name": "ghost_group"},
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+
+        assert "overlay targets unknown host 'ghost_host'" in str(exc_info.value)
+
+    def test_overlay_target_all_group_allowed(self):
+        """The implicit 'all' group is a valid group_vars overlay target."""
+        data = load_base_spec()
+
+        data["variable_contracts"][0]["grading_overlay_targets"] = [
+            {"overlay_kind": "group_vars", "target_name": "all"}
+        ]
+
+        spec = HammerSpec.model_validate(data)
+        targets = spec.variable_contracts[0].grading_overlay_targets
+        assert targets[0].target_name == "all"
+
     def test_node_selector_nonexistent_group(self):
         """Node selector referencing a non-existent group."""
         data = load_base_spec()
@@ -189,6 +215,32 @@ class TestHandlerContracts:
 
         assert "Unknown group in selector: bad_group" in str(exc_info.value)
 
+    def test_first_unknown_selector_host_reported(self):
+        """The first unknown selector host in spec order is reported."""
+        data = load_base_spec()
+
+        packages = data["behavioral_contracts"]["packages"]
+        packages[0]["node_selector"] = {"host": "ghost_a"}
+        data["handler_contracts"][0]["node_selector"] = {"host": "ghost_b"}
+
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+
+        assert "Unknown host in selector: ghost_a" in str(exc_info.value)
+
+    def test_unknown_group_before_unknown_host_reported(self):
+        """An unknown group in an earlier contract wins over a later host."""
+        data = load_base_spec()
+
+        packages = data["behavioral_contracts"]["packages"]
+        packages[0]["node_selector"] = {"group": "ghost_group"}
+        data["handler_contracts"][0]["node_selector"] = {"host": "ghost_host"}
+
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+
+        assert "Unknown group in selector: ghost_group" in str(exc_info.value)
+
     def test_handler_without_feature_enabled(self):
         """Handler contracts require features.handlers=true."""
         data = load_base_spec()
@@ -226,6 +278,17 @@ class TestPrecedenceScenarios:
 
         assert "index 99 out of range" in str(exc_info.value)
 
+    def test_precedence_binding_index_negative(self):
+        """Negative precedence binding indexes are rejected."""
+        data = load_base_spec()
+
+        data["precedence_scenarios"][0]["bindings_to_verify"] = [-1]
+
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+
+        assert "index -1 out of range" in str(exc_info.value)
+
     def test_precedence_expected_winner_not_in_layers(self):
         """Expected winner must be in the layers list."""
         data = load_base_spec()
@@ -266,6 +329,18 @@ class TestPhaseOverlays:
 
         assert "Variable 'http_port' has bindings but is never set in phase_overlays" in str(exc_info.value)
 
+    def test_variable_set_only_in_mutation_host_vars(self):
+        """A variable set by any overlay mapping counts as covered."""
+        data = load_base_spec()
+
+        data["phase_overlays"]["baseline"]["group_vars"]["web"].pop("http_port", None)
+        data["phase_overlays"]["mutation"]["group_vars"]["web"].pop("http_port", None)
+        data["phase_overlays"]["mutation"]["extra_vars"].pop("http_port", None)
+        data["phase_overlays"]["mutation"]["host_vars"] = {"web1": {"http_port": 9090}}
+
+        spec = HammerSpec.model_validate(data)
+        assert spec.phase_overlays.mutation.host_vars["web1"]["http_port"] == 9090
+
 
 class TestTopologyValidation:
     """Tests for topology validation."""
@@ -354,3 +429,48 @@ class TestResourceLimits:
             HammerSpec.model_validate(data)
 
         assert "less than or equal to 65535" in str(exc_info.value).lower()
+
+
+class TestUnionDiscrimination:
+    """Tests for picking union members by their identifying key."""
+
+    def test_binding_targets_resolve_by_key(self):
+        """Each binding target resolves to the model owning its key."""
+        from hammer.spec import Binding, FileModeTarget, FileOwnerTarget, FilePathTarget
+
+        cases = [
+            ({"path": "/etc/motd"}, FilePathTarget),
+            ({"path": "/etc/motd", "mode": "0644"}, FileModeTarget),
+            ({"path": "/etc/motd", "owner": "root", "group": "root"}, FileOwnerTarget),
+        ]
+        for target, expected in cases:
+            binding = Binding.model_validate({"type": "file_exists", "target": target})
+            assert type(binding.target) is expected
+
+    def test_trigger_without_known_key_rejected(self):
+        """A trigger carrying none of the trigger keys is rejected clearly."""
+        data = load_base_spec()
+
+        data["handler_contracts"][0]["trigger_conditions"] = [{"file_touched": "/etc/x"}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+
+        assert "Expected one of the keys: file_changed" in str(exc_info.value)
+
+    def test_port_ref_accepts_int_and_var(self):
+        """Port references accept plain ports and variable references."""
+        data = load_base_spec()
+        data["variable_contracts"] = None
+        data["precedence_scenarios"] = None
+        data["behavioral_contracts"]["reachability"] = []
+        data["handler_contracts"][0]["trigger_conditions"] = [{"file_changed": "/etc/x"}]
+        data["behavioral_contracts"]["firewall"][0]["open_ports"][0]["port"] = 8080
+
+        spec = HammerSpec.model_validate(data)
+        assert spec.behavioral_contracts.firewall[0].open_ports[0].port == 8080
+
+        data["behavioral_contracts"]["firewall"][0]["open_ports"][0]["port"] = {"var": "p"}
+        with pytest.raises(ValidationError) as exc_info:
+            HammerSpec.model_validate(data)
+        assert "undefined variable 'p'" in str(exc_info.value)
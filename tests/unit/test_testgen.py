@@ -22,8 +22,11 @@ from hammer.testgen.behavioral import (
     generate_file_tests,
     generate_firewall_tests,
     generate_handler_tests,
+    _interpolate_vars,
 )
 from hammer.testgen.reachability import generate_reachability_tests
+from hammer.testgen.utils import make_safe_name, resolve_port
+from hammer.spec.contracts import PortRefVar
 
 FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures"
 
@@ -70,6 +73,14 @@ class TestBindingTestGeneration:
             name = test["test_name"]
             assert name.isidentifier(), f"'{name}' is not a valid Python identifier"
 
+    def test_binding_hosts_follow_group_scope(self, full_spec, plan):
+        """group_vars targets should limit bindings to the group's hosts."""
+        contract = plan.contracts["baseline"]
+        tests = generate_binding_tests(full_spec, contract, "baseline")
+
+        web_hosts = set(full_spec.topology.group_members["web"])
+        assert {t["host"] for t in tests} == web_hosts
+
 
 class TestPackageTestGeneration:
     """Tests for package test generation."""
@@ -213,6 +224,75 @@ class TestHandlerTestGeneration:
         assert nginx_handler["expected_runs"] == "zero"
 
 
+class TestInterpolateVars:
+    """Tests for {{ var }} placeholder interpolation."""
+
+    def test_spaced_and_unspaced_placeholders(self):
+        """Both placeholder spellings should be substituted."""
+        result = _interpolate_vars(
+            "http://{{ host }}:{{port}}/", {"host": "web", "port": 8080}
+        )
+        assert result == "http://web:8080/"
+
+    def test_plain_string_returned_unchanged(self):
+        """Strings without a placeholder marker should be returned as is."""
+        url = "http://localhost:8080/health"
+        assert _interpolate_vars(url, {"port": 80}) is url
+        assert _interpolate_vars("", {"port": 80}) == ""
+
+    def test_unknown_placeholder_left_alone(self):
+        """Placeholders without a resolved value should stay verbatim."""
+        assert _interpolate_vars("/{{ missing }}", {"port": 80}) == "/{{ missing }}"
+
+    def test_values_are_not_reinterpolated(self):
+        """Substituted values should not be scanned for placeholders again."""
+        result = _interpolate_vars("{{ a }}", {"a": "{{ b }}", "b": "x"})
+        assert result == "{{ b }}"
+
+
+class TestResolvePort:
+    """Tests for port reference resolution."""
+
+    @pytest.mark.parametrize("port_val, expected", [
+        (8080, 8080),
+        ({"var": "http_port"}, 9090),
+        (PortRefVar(var="http_port"), 9090),
+        ({"var": "unknown"}, {"var": "unknown"}),
+        ({"port": 80}, {"port": 80}),
+        ("8080", "8080"),
+    ])
+    def test_resolve_port(self, port_val, expected):
+        """Literal ports pass through and references resolve."""
+        assert resolve_port(port_val, {"http_port": 9090}) == expected
+
+
+class TestMakeSafeName:
+    """Tests for identifier sanitisation."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("/etc/nginx/nginx.conf", "etc_nginx_nginx_conf"),
+        ("http://localhost:8080/", "http_localhost_8080"),
+        ("123abc", "abc"),
+        ("1_2abc", "2abc"),
+        ("a-_-b", "a_b"),
+        ("__Foo--Bar__", "foo_bar"),
+        ("caf\u00e9 menu", "caf_menu"),
+        ("", ""),
+    ])
+    def test_make_safe_name(self, raw, expected):
+        """Names should reduce to lowercase identifiers."""
+        assert make_safe_name(raw) == expected
+
+    def test_make_safe_name_is_memoized(self, plan):
+        """Repeated paths across phases should hit the cache."""
+        make_safe_name.cache_clear()
+        for phase in ("baseline", "mutation", "idempotence"):
+            generate_file_tests(plan.contracts[phase])
+        info = make_safe_name.cache_info()
+        assert info.hits > 0
+        assert info.misses <= info.currsize
+
+
 class TestFullTestGeneration:
     """Integration tests for full test generation."""
 
@@ -289,3 +369,25 @@ class TestFullTestGeneration:
                 # Baseline should have 8080, mutation should have 9090
                 assert "8080" in baseline_content
                 assert "9090" in mutation_content
+
+    def test_jinja_environment_is_shared(self, full_spec, plan, network):
+        """Repeated generation should reuse one Jinja2 environment."""
+        from hammer.testgen import _get_env
+
+        env = _get_env()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_tests(full_spec, plan, network, Path(tmpdir))
+        assert _get_env() is env
+        assert env.auto_reload is False
+        assert env.filters["pyescape"]("a'b") == "a\\'b"
+
+    def test_templates_are_compiled_once(self, full_spec, plan, network):
+        """Phase generation should reuse the same compiled templates."""
+        from hammer.testgen import _get_template
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_tests(full_spec, plan, network, Path(tmpdir))
+        template = _get_template("test_packages.py.j2")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_tests(full_spec, plan, network, Path(tmpdir))
+        assert _get_template("test_packages.py.j2") is template